@@ -1,16 +1,113 @@
 import os
-import requests
+import json
+import asyncio
+import time
+import hashlib
+from collections import OrderedDict
+import httpx
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from semantic_cache import LSHCache, content_words, embed_query
 
 app = FastAPI()
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 PROMPTFLOW_ENDPOINT = os.getenv("PROMPTFLOW_ENDPOINT")
 PROMPTFLOW_KEY = os.getenv("PROMPTFLOW_KEY")
+
+# Shared client so /ask reuses keep-alive connections to Prompt Flow
+_http = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=httpx.Timeout(30.0)
+)
+
+# Answers for near-duplicate queries are served without calling Prompt Flow
+_semantic_cache = LSHCache(
+    threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.95)),
+    ttl=float(os.getenv("SEMANTIC_CACHE_TTL", 3600))
+)
+
+# Exact-repeat payloads skip both the semantic probe and Prompt Flow
+_RESPONSE_CACHE_TTL = 300
+_RESPONSE_CACHE_MAXSIZE = 1024
+_response_cache = OrderedDict()  # payload digest -> (timestamp, response)
+
+def _payload_key(payload):
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+def _semantic_guard(payload):
+    """Exact-match part of a semantic cache lookup: the query's content words and every other payload field"""
+    context = {k: v for k, v in payload.items() if k != "query"}
+    return content_words(str(payload.get("query", ""))), _payload_key(context)
+
+def _get_cached_response(key):
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    timestamp, response = entry
+    if time.monotonic() - timestamp >= _RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return response
+
+def _store_response(key, response):
+    _response_cache[key] = (time.monotonic(), response)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+        _response_cache.popitem(last=False)
+
+async def _warm_promptflow_connection():
+    """Open a pooled connection to Prompt Flow so the first /ask skips the TCP+TLS handshake"""
+    try:
+        await _http.head(PROMPTFLOW_ENDPOINT, timeout=5.0)
+    except httpx.HTTPError:
+        pass
+
+@app.on_event("startup")
+async def warm_http_client():
+    if PROMPTFLOW_ENDPOINT:
+        # Run in the background so startup isn't held up by a slow endpoint
+        app.state.warmup_task = asyncio.create_task(_warm_promptflow_connection())
+
+@app.on_event("shutdown")
+async def close_http_client():
+    # A warm-up HEAD still in flight must finish before the client it uses is closed
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None:
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+    await _http.aclose()
+
+async def _relay_and_cache(response, cache_key, query_vector, guard):
+    """Yield the upstream body while keeping a copy to cache successful answers"""
+    body = []
+    async for chunk in response.aiter_bytes():
+        body.append(chunk)
+        yield chunk
+
+    if response.status_code != 200:
+        return
+    try:
+        data = json.loads(b"".join(body))
+    except ValueError:
+        return
+    if isinstance(data, dict) and "answer" in data:
+        _store_response(cache_key, data)
+        await _semantic_cache.put(query_vector, guard, data)
+
 @app.get("/")
 def root():
     return {"message": "Backend is running"}
 
-@app.get("/health") 
+@app.get("/health")
 def health():
     return {"status": "healthy"}
 @app.post("/ask")
@@ -19,5 +116,24 @@ async def ask_question(payload: dict):
         "Authorization": f"Bearer {PROMPTFLOW_KEY}",
         "Content-Type": "application/json"
     }
-    response = requests.post(PROMPTFLOW_ENDPOINT, headers=headers, json=payload)
-    return response.json()
+    cache_key = _payload_key(payload)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return JSONResponse(cached)
+
+    # Near-hits aren't promoted into the exact cache; they stay subject to the semantic TTL
+    query_vector = embed_query(str(payload.get("query", "")))
+    guard = _semantic_guard(payload)
+    cached = _semantic_cache.get(query_vector, guard)
+    if cached is not None:
+        return JSONResponse(cached)
+
+    # Forward the Prompt Flow body as it arrives instead of buffering and re-encoding it
+    request = _http.build_request("POST", PROMPTFLOW_ENDPOINT, headers=headers, json=payload)
+    response = await _http.send(request, stream=True)
+    return StreamingResponse(
+        _relay_and_cache(response, cache_key, query_vector, guard),
+        status_code=response.status_code,
+        media_type=response.headers.get("content-type", "application/json"),
+        background=BackgroundTask(response.aclose)
+    )
@@ -0,0 +1,160 @@
+"""
+In-process semantic cache for /ask responses.
+
+Queries are mapped to a sparse hashed bag-of-words vector (unigrams plus
+bigrams, so word order still matters) and indexed with random-hyperplane
+LSH. Each vector is hashed into several bands of hyperplane bits; a lookup
+only compares against entries sharing at least one band, then confirms the
+hit with an exact cosine similarity check.
+
+Bag-of-words similarity can't tell apart long questions that differ only in
+their key noun, so every entry also carries an exact-match guard: the
+query's set of content words plus whatever else in the request shapes the
+answer. A near-hit is only served when the guards are equal, which leaves
+the similarity check to absorb word order, casing, punctuation and filler
+words.
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+VECTOR_DIM = 4096
+NUM_BANDS = 8
+BITS_PER_BAND = 8
+SIM_THRESHOLD = 0.95
+DEFAULT_TTL = 3600
+DEFAULT_MAX_ENTRIES = 1024
+EMBEDDING_CACHE_SIZE = 4096
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Filler words that may differ between two phrasings of the same question.
+# Negations and question words are deliberately absent: they change the answer.
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "from", "by", "with", "about",
+    "and", "or", "is", "are", "was", "were", "be", "been", "do", "does", "did",
+    "me", "i", "you", "can", "could", "would", "please", "tell", "show", "give",
+})
+
+
+def _bucket(feature):
+    digest = hashlib.blake2b(feature.encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % VECTOR_DIM
+
+
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def embed_query(query):
+    """
+    Return an L2-normalized sparse vector ({dim: weight}) for a query.
+
+    Results are memoized per query string, so the returned dict is shared
+    and must not be mutated.
+    """
+    tokens = _TOKEN_RE.findall(query.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    vector = {}
+    for feature in features:
+        idx = _bucket(feature)
+        vector[idx] = vector.get(idx, 0.0) + 1.0
+
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return {idx: v / norm for idx, v in vector.items()} if norm else {}
+
+
+@lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def content_words(query):
+    """Return the query's tokens minus filler words, for use in a cache guard."""
+    return frozenset(t for t in _TOKEN_RE.findall(query.lower()) if t not in _STOP_WORDS)
+
+
+def cosine_similarity(a, b):
+    """Cosine similarity of two normalized sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(idx, 0.0) for idx, v in a.items())
+
+
+class LSHCache:
+    """LRU-bounded, TTL-expiring cache keyed by query similarity."""
+
+    def __init__(self, threshold=SIM_THRESHOLD, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, seed=0):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        rng = random.Random(seed)
+        self._planes = [
+            [rng.gauss(0.0, 1.0) for _ in range(VECTOR_DIM)]
+            for _ in range(NUM_BANDS * BITS_PER_BAND)
+        ]
+        self._entries = OrderedDict()  # entry id -> (vector, guard, signature, response, timestamp)
+        self._buckets = {}  # (band, band bits) -> set of entry ids
+        self._next_id = 0
+        self._lock = asyncio.Lock()
+
+    def _signature(self, vector):
+        bits = [
+            sum(v * plane[idx] for idx, v in vector.items()) >= 0.0
+            for plane in self._planes
+        ]
+        return [
+            (band, tuple(bits[band * BITS_PER_BAND:(band + 1) * BITS_PER_BAND]))
+            for band in range(NUM_BANDS)
+        ]
+
+    def _remove(self, entry_id):
+        _, _, signature, _, _ = self._entries.pop(entry_id)
+        for key in signature:
+            ids = self._buckets.get(key)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._buckets[key]
+
+    def get(self, vector, guard):
+        """Return the cached response for a similar query stored under an equal guard, or None."""
+        if not vector:
+            return None
+
+        candidates = set()
+        for key in self._signature(vector):
+            candidates.update(self._buckets.get(key, ()))
+
+        now = time.monotonic()
+        best_id, best_sim = None, self.threshold
+        for entry_id in candidates:
+            entry_vector, entry_guard, _, _, timestamp = self._entries[entry_id]
+            if entry_guard != guard or now - timestamp >= self.ttl:
+                continue
+            sim = cosine_similarity(vector, entry_vector)
+            if sim >= best_sim:
+                best_id, best_sim = entry_id, sim
+
+        if best_id is None:
+            return None
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][3]
+
+    async def put(self, vector, guard, response):
+        """Store a response for the query vector and guard, evicting the least recently used entry when full."""
+        if not vector:
+            return
+
+        async with self._lock:
+            signature = self._signature(vector)
+            entry_id = self._next_id
+            self._next_id += 1
+
+            self._entries[entry_id] = (vector, guard, signature, response, time.monotonic())
+            for key in signature:
+                self._buckets.setdefault(key, set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
@@ -1,6 +1,8 @@
 """Configuration management using environment variables"""
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,8 +16,10 @@ DATABASE_NAME = os.getenv('DATABASE_NAME', 'CyberSecurity Database 2')
 # Scraper Configuration
 MAX_POSTS_PER_SCRAPER = int(os.getenv('MAX_POSTS_PER_SCRAPER', 5))
 DELAY_BETWEEN_REQUESTS = float(os.getenv('DELAY_BETWEEN_REQUESTS', 1.0))
-DELAY_BETWEEN_SCRAPERS = float(os.getenv('DELAY_BETWEEN_SCRAPERS', 2.0))
 REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 10))
+MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', 4))
+# SQLite file for parsed posts revalidated via ETag/Last-Modified; empty disables it
+POST_CACHE_PATH = os.getenv('POST_CACHE_PATH', 'post_cache.db')
 
 # Individual scraper settings (with fallback to global setting)
 OKTA_MAX_POSTS = int(os.getenv('OKTA_MAX_POSTS', MAX_POSTS_PER_SCRAPER))
@@ -36,17 +40,20 @@ def validate_config():
     
     return True
 
+_CONFIG_MAP = {
+    'Okta': OKTA_MAX_POSTS,
+    'Mandiant': MANDIANT_MAX_POSTS,
+    'Palo Alto': PALOALTO_MAX_POSTS,
+    'CrowdStrike': CROWDSTRIKE_MAX_POSTS
+}
+
+@lru_cache(maxsize=None)
 def get_scraper_config(scraper_name):
-    """Get configuration for a specific scraper"""
-    config_map = {
-        'Okta': OKTA_MAX_POSTS,
-        'Mandiant': MANDIANT_MAX_POSTS, 
-        'Palo Alto': PALOALTO_MAX_POSTS,
-        'CrowdStrike': CROWDSTRIKE_MAX_POSTS
-    }
-    
-    return {
-        'max_posts': config_map.get(scraper_name, MAX_POSTS_PER_SCRAPER),
+    """Get configuration for a specific scraper (cached, read-only)"""
+    return MappingProxyType({
+        'max_posts': _CONFIG_MAP.get(scraper_name, MAX_POSTS_PER_SCRAPER),
         'delay_between_requests': DELAY_BETWEEN_REQUESTS,
-        'request_timeout': REQUEST_TIMEOUT
-    }
\ No newline at end of file
+        'request_timeout': REQUEST_TIMEOUT,
+        'max_concurrent_requests': MAX_CONCURRENT_REQUESTS,
+        'post_cache_path': POST_CACHE_PATH
+    })
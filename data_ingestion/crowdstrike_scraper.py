@@ -6,19 +6,56 @@ extract metadata, text content, image URLs, and outbound links from a
 series of recent blog posts.
 """
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from datetime import datetime
 import pytz
 import logging
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from throttle import RequestThrottle
 
 # Configure logger
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# CSS selectors (soupsieve caches the compiled form of each)
+_POST_LINK_SELECTOR = 'div#blogAutoGenerationDiv div.col-12.col-lg-4.post_image'
+_CONTENT_SELECTOR = 'div.container-wp.aem-GridColumn.aem-GridColumn--default--12'
+_TITLE_SELECTOR = 'div.headline.aem-GridColumn.aem-GridColumn--default--12 h1'
+_DATE_SELECTOR = 'div.publish_info p'
+
+_EASTERN = pytz.timezone('US/Eastern')
+_DATE_FMT = '%B %d, %Y'
+
+def _fast_text(element):
+    """Stripped text of an element, skipping the subtree walk when it holds a single string."""
+    text = element.string
+    if text is not None:
+        return text.strip()
+    return element.get_text(separator=' ').strip()
+
+class _ContentState:
+    """Accumulators shared by the element handlers while processing one post."""
+
+    def __init__(self):
+        self.text_sections = []
+        self.img_urls = []
+        self.outbound_links = []
+        self.seen_imgs = set()
+        self.seen_links = set()
+        self.current_parts = []
+
+    def flush_section(self):
+        """Moves the current section, if it has any text, into text_sections."""
+        current_section = "".join(self.current_parts)
+        if current_section:
+            self.text_sections.append(current_section.strip())
+        self.current_parts = []
+
 class CrowdStrikeScraper:
     BASE_URL = "https://www.crowdstrike.com"
     BLOG_URL = "https://www.crowdstrike.com/en-us/blog/recent-articles/"
@@ -26,24 +63,62 @@ class CrowdStrikeScraper:
     DOMAIN = "CrowdStrike"
 
     def __init__(self, config=None):
-        self.session = requests.Session()
         if config:
             self.MAX_POSTS = config.get('max_posts', 5)
             self.REQUEST_TIMEOUT = config.get('request_timeout', 10)
             self.DELAY_BETWEEN_REQUESTS = config.get('delay_between_requests', 1)
+            self.MAX_CONCURRENT_REQUESTS = config.get('max_concurrent_requests', 4)
         else:
             self.MAX_POSTS = 5
             self.REQUEST_TIMEOUT = 10
             self.DELAY_BETWEEN_REQUESTS = 1
-        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+            self.MAX_CONCURRENT_REQUESTS = 4
+
+        # Concurrent fetches share a bounded, politely spaced set of request slots
+        self.throttle = RequestThrottle(self.MAX_CONCURRENT_REQUESTS, self.DELAY_BETWEEN_REQUESTS)
+
+        # HTTP/2 lets the parallel post fetches share one connection; brotli/gzip shrink the HTML
+        self.session = httpx.Client(
+            http2=True,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept-Encoding': 'gzip, br'
+            },
+            timeout=self.REQUEST_TIMEOUT,
+            follow_redirects=True
+        )
+
+        # Maps content tag names to the handler that renders them
+        self._dispatch = {
+            'h2': self._handle_h2,
+            'p': self._handle_p,
+            'ul': self._handle_list,
+            'ol': self._handle_list,
+            'img': self._handle_img,
+            'figure': self._handle_figure,
+            'pre': self._handle_pre,
+            'table': self._handle_table,
+        }
+
+    def close(self):
+        """Closes the HTTP/2 connection pool held by the session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     def fetch_page(self, url):
         """Fetches the HTML content of a given URL."""
         try:
-            resp = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+            with self.throttle:
+                resp = self.session.get(url)
             resp.raise_for_status()
             return resp.text
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
 
@@ -53,18 +128,15 @@ class CrowdStrikeScraper:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         blog_links = []
 
-        blog_section = soup.find('div', id='blogAutoGenerationDiv')
-        if blog_section:
-            articles = blog_section.find_all('div', class_='col-12 col-lg-4 post_image')
-            for article in articles[:self.MAX_POSTS]:
-                link_tag = article.find('a', href=True)
-                if link_tag and link_tag.get('href'):
-                    href = urljoin(self.BASE_URL, link_tag['href'])
-                    blog_links.append(href)
-                    logger.info(f"Found recent post: {href}")
+        for article in soup.select(_POST_LINK_SELECTOR, limit=self.MAX_POSTS):
+            link_tag = article.find('a', href=True)
+            if link_tag and link_tag.get('href'):
+                href = urljoin(self.BASE_URL, link_tag['href'])
+                blog_links.append(href)
+                logger.info(f"Found recent post: {href}")
 
         logger.info(f"Found {len(blog_links)} latest posts")
         return blog_links
@@ -81,100 +153,103 @@ class CrowdStrikeScraper:
             tuple: A tuple containing a list of text sections (list),
                   a list of all image URLs (list), and a list of all outbound links (list).
         """
-        text_sections = []
-        img_urls = []
-        outbound_links = []
-        current_section = ""
-
         # Find the main content container
-        content_div = soup.find('div', class_='container-wp aem-GridColumn aem-GridColumn--default--12')
+        content_div = soup.select_one(_CONTENT_SELECTOR)
         if not content_div:
             return [], [], []
 
-        # Find all relevant elements in the correct order
-        relevant_elements = content_div.find_all(['h2', 'p', 'ul', 'ol', 'img', 'figure', 'pre', 'table'])
-
-        for element in relevant_elements:
-            if element.name == 'h2':
-                # Start a new section with a heading
-                if current_section:
-                    text_sections.append(current_section.strip())
-                current_section = f"## {element.get_text(strip=True)}\n\n"
-            elif element.name == 'p':
-                # Append a new paragraph to the current section
-                current_section += self.process_paragraph(element, img_urls, outbound_links) + "\n\n"
-            elif element.name in ['ul', 'ol']:
-                # Append a list to the current section
-                current_section += self.process_list(element, outbound_links) + "\n"
-            elif element.name == 'img':
-                # Process an image and add its Markdown to the current section
-                img_data = self.process_image(element)
-                if img_data:
-                    # Add to master list if not already present
-                    if not any(d['img_url'] == img_data['img_url'] for d in img_urls):
-                        img_urls.append(img_data)
-                    current_section += f"![{img_data.get('alt_text', '')}]({img_data.get('img_url', '')})\n"
-            elif element.name == 'figure':
-                # Process a figure which may contain an image and a caption
-                current_section += self.process_figure(element, img_urls, outbound_links)
-            elif element.name == 'pre':
-                # Process a code block
-                current_section += self.process_code_block(element) + "\n"
-            elif element.name == 'table':
-                # Process a table
-                current_section += self.process_table(element, outbound_links)
+        state = _ContentState()
 
-        # Add the last section
-        if current_section:
-            text_sections.append(current_section.strip())
-
-        return text_sections, img_urls, outbound_links
+        # Find all relevant elements in the correct order and hand each to its handler
+        for element in content_div.find_all(list(self._dispatch)):
+            self._dispatch[element.name](element, state)
 
-    def process_paragraph(self, p_element, img_urls, outbound_links):
+        # Add the last section
+        state.flush_section()
+
+        return state.text_sections, state.img_urls, state.outbound_links
+
+    def _handle_h2(self, element, state):
+        """Starts a new section with a heading."""
+        state.flush_section()
+        state.current_parts.append(f"## {element.get_text(strip=True)}\n\n")
+
+    def _handle_p(self, element, state):
+        """Appends a new paragraph to the current section."""
+        state.current_parts.append(self.process_paragraph(element, state.img_urls, state.seen_imgs, state.outbound_links, state.seen_links))
+        state.current_parts.append("\n\n")
+
+    def _handle_list(self, element, state):
+        """Appends a list to the current section."""
+        state.current_parts.append(self.process_list(element, state.outbound_links, state.seen_links))
+        state.current_parts.append("\n")
+
+    def _handle_img(self, element, state):
+        """Processes an image and adds its Markdown to the current section."""
+        img_data = self.process_image(element)
+        if img_data:
+            # Add to master list if not already present
+            self.add_image(img_data, state.img_urls, state.seen_imgs)
+            state.current_parts.append(f"![{img_data.get('alt_text', '')}]({img_data.get('img_url', '')})\n")
+
+    def _handle_figure(self, element, state):
+        """Processes a figure which may contain an image and a caption."""
+        state.current_parts.append(self.process_figure(element, state.img_urls, state.seen_imgs, state.outbound_links, state.seen_links))
+
+    def _handle_pre(self, element, state):
+        """Processes a code block."""
+        state.current_parts.append(self.process_code_block(element))
+        state.current_parts.append("\n")
+
+    def _handle_table(self, element, state):
+        """Processes a table."""
+        state.current_parts.append(self.process_table(element, state.outbound_links, state.seen_links))
+
+    def process_paragraph(self, p_element, img_urls, seen_imgs, outbound_links, seen_links):
         """Processes a paragraph element, including nested links and images."""
-        text = ""
+        parts = []
         for element in p_element.children:
             if hasattr(element, 'name'):
                 if element.name == 'a':
-                    link_text, link_url = self.process_link(element, outbound_links)
-                    text += f"[{link_text}]({link_url})"
+                    link_text, link_url = self.process_link(element, outbound_links, seen_links)
+                    parts.append(f"[{link_text}]({link_url})")
                 elif element.name == 'img':
                     img_data = self.process_image(element)
                     if img_data:
-                        if not any(d['img_url'] == img_data['img_url'] for d in img_urls):
-                            img_urls.append(img_data)
-                        text += f"![{img_data['alt_text']}]({img_data['img_url']})"
+                        self.add_image(img_data, img_urls, seen_imgs)
+                        parts.append(f"![{img_data['alt_text']}]({img_data['img_url']})")
                 elif element.name == 'code':
-                    text += f"`{element.get_text(separator=' ').strip()}`"
+                    parts.append(f"`{_fast_text(element)}`")
                 elif element.name == 'strong':
-                    text += f"**{element.get_text(separator=' ').strip()}**"
+                    parts.append(f"**{_fast_text(element)}**")
                 else:
-                    text += element.get_text(separator=' ')
+                    parts.append(element.get_text(separator=' '))
             else:
-                text += str(element)
-        return text.strip()
+                parts.append(str(element))
+        return "".join(parts).strip()
 
-    def process_list(self, list_element, outbound_links):
+    def process_list(self, list_element, outbound_links, seen_links):
         """Processes an ordered or unordered list."""
-        list_text = ""
+        list_parts = []
         for li in list_element.find_all('li', recursive=False):
-            li_text = ""
+            li_parts = []
             for element in li.children:
                 if hasattr(element, 'name'):
                     if element.name == 'a':
-                        link_text, link_url = self.process_link(element, outbound_links)
-                        li_text += f"[{link_text}]({link_url})"
+                        link_text, link_url = self.process_link(element, outbound_links, seen_links)
+                        li_parts.append(f"[{link_text}]({link_url})")
                     elif element.name == 'code':
-                        li_text += f"`{element.get_text(separator=' ').strip()}`"
+                        li_parts.append(f"`{_fast_text(element)}`")
                     elif element.name == 'strong':
-                        li_text += f"**{element.get_text(separator=' ').strip()}**"
+                        li_parts.append(f"**{_fast_text(element)}**")
                     else:
-                        li_text += element.get_text(separator=' ')
+                        li_parts.append(element.get_text(separator=' '))
                 else:
-                    li_text += str(element)
-            if li_text.strip():
-                list_text += f"• {li_text.strip()}\n"
-        return list_text
+                    li_parts.append(str(element))
+            li_text = "".join(li_parts).strip()
+            if li_text:
+                list_parts.append(f"• {li_text}\n")
+        return "".join(list_parts)
 
     def process_code_block(self, pre_element):
         """Processes a preformatted code block."""
@@ -182,54 +257,54 @@ class CrowdStrikeScraper:
         code_text = code_element.get_text() if code_element else pre_element.get_text()
         return f"```\n{code_text}\n```"
 
-    def process_table(self, table_element, outbound_links):
+    def process_table(self, table_element, outbound_links, seen_links):
         """Processes an HTML table and converts it to Markdown."""
-        table_text = ""
         rows = table_element.find_all('tr')
         if not rows:
             return ""
 
         header_row = rows[0]
-        headers = [self.process_link_in_element(th, outbound_links) for th in header_row.find_all(['th', 'td'])]
-        table_text += "| " + " | ".join(headers) + " |\n"
-        table_text += "| " + " | ".join(["---"] * len(headers)) + " |\n"
+        headers = [self.process_link_in_element(th, outbound_links, seen_links) for th in header_row.find_all(['th', 'td'])]
+        table_parts = [
+            "| " + " | ".join(headers) + " |\n",
+            "| " + " | ".join(["---"] * len(headers)) + " |\n",
+        ]
 
         for row in rows[1:]:
-            cells = [self.process_link_in_element(td, outbound_links) for td in row.find_all(['td', 'th'])]
+            cells = [self.process_link_in_element(td, outbound_links, seen_links) for td in row.find_all(['td', 'th'])]
             if cells:
-                table_text += "| " + " | ".join(cells) + " |\n"
-        return table_text
+                table_parts.append("| " + " | ".join(cells) + " |\n")
+        return "".join(table_parts)
 
-    def process_link_in_element(self, element, outbound_links):
+    def process_link_in_element(self, element, outbound_links, seen_links):
         """Processes a link within a parent element."""
-        text = ""
+        parts = []
         for child in element.children:
             if hasattr(child, 'name') and child.name == 'a':
-                link_text, link_url = self.process_link(child, outbound_links)
-                text += f"[{link_text}]({link_url})"
+                link_text, link_url = self.process_link(child, outbound_links, seen_links)
+                parts.append(f"[{link_text}]({link_url})")
             elif hasattr(child, 'name') and child.name == 'code':
-                text += f"`{child.get_text(separator=' ').strip()}`"
+                parts.append(f"`{_fast_text(child)}`")
             else:
-                text += child.get_text(separator=' ').strip()
-        return text.strip()
+                parts.append(child.get_text(separator=' ').strip())
+        return "".join(parts).strip()
 
-    def process_figure(self, figure_element, img_urls, outbound_links):
+    def process_figure(self, figure_element, img_urls, seen_imgs, outbound_links, seen_links):
         """Processes a figure element containing an image and a caption."""
-        figure_text = ""
+        figure_parts = []
         img = figure_element.find('img')
         if img:
             img_data = self.process_image(img)
             if img_data:
-                if not any(d['img_url'] == img_data['img_url'] for d in img_urls):
-                    img_urls.append(img_data)
-                figure_text += f"![{img_data.get('alt_text', '')}]({img_data.get('img_url', '')})\n"
+                self.add_image(img_data, img_urls, seen_imgs)
+                figure_parts.append(f"![{img_data.get('alt_text', '')}]({img_data.get('img_url', '')})\n")
 
         figcaption = figure_element.find('figcaption')
         if figcaption:
-            caption_text = self.process_link_in_element(figcaption, outbound_links)
+            caption_text = self.process_link_in_element(figcaption, outbound_links, seen_links)
             if caption_text.strip():
-                figure_text += f"*{caption_text}*\n"
-        return figure_text
+                figure_parts.append(f"*{caption_text}*\n")
+        return "".join(figure_parts)
 
     def process_image(self, img_element):
         """Extracts image URL and alt text."""
@@ -238,7 +313,13 @@ class CrowdStrikeScraper:
             return {}
         return {"img_url": urljoin(self.BASE_URL, src), "alt_text": img_element.get('alt', 'image')}
 
-    def process_link(self, a_element, outbound_links):
+    def add_image(self, img_data, img_urls, seen_imgs):
+        """Appends image data to img_urls unless its URL was already collected."""
+        if img_data['img_url'] not in seen_imgs:
+            seen_imgs.add(img_data['img_url'])
+            img_urls.append(img_data)
+
+    def process_link(self, a_element, outbound_links, seen_links):
         """Extracts link text and URL, handling absolute and relative paths."""
         link_text = a_element.get_text(separator=' ').strip()
         link_url = a_element.get('href', '').strip()
@@ -248,36 +329,38 @@ class CrowdStrikeScraper:
         absolute_url = urljoin(self.BASE_URL, link_url)
 
         if not absolute_url.startswith(self.BASE_URL):
-            if absolute_url not in outbound_links:
+            if absolute_url not in seen_links:
+                seen_links.add(absolute_url)
                 outbound_links.append(absolute_url)
 
         return link_text, absolute_url
 
-    def parse_post(self, webpage_url):
+    def parse_post(self, webpage_url, date_pulled=None):
         """Extracts title, date, text, images, and outbound links from a single blog post."""
+        logger.info(f"Parsing post: {webpage_url}")
         html = self.fetch_page(webpage_url)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Extract title from the specified div
-        title_element = soup.find('div', class_='headline aem-GridColumn aem-GridColumn--default--12')
-        title = title_element.find('h1').get_text(strip=True) if title_element and title_element.find('h1') else "No Title"
+        title_element = soup.select_one(_TITLE_SELECTOR)
+        title = title_element.get_text(strip=True) if title_element else "No Title"
 
         # Extract date from the specified div
         date_published = None
-        date_element = soup.find('div', class_='publish_info')
-        if date_element and date_element.find('p'):
-            original_date_str = date_element.find('p').get_text(strip=True)
+        date_element = soup.select_one(_DATE_SELECTOR)
+        if date_element:
+            original_date_str = date_element.get_text(strip=True)
             try:
-                dt_object = datetime.strptime(original_date_str, '%B %d, %Y')
+                dt_object = datetime.strptime(original_date_str, _DATE_FMT)
                 date_published = dt_object.strftime("%Y-%m-%d")
             except ValueError:
                 date_published = original_date_str
 
-        eastern = pytz.timezone('US/Eastern')
-        date_pulled = datetime.now(eastern).date().isoformat()
+        if date_pulled is None:
+            date_pulled = datetime.now(_EASTERN).date().isoformat()
 
         # Process the main content div
         text_content, img_urls, outbound_links = self.process_text_content(soup)
@@ -295,13 +378,15 @@ class CrowdStrikeScraper:
         return post_data
 
     def scrape_all_posts(self):
-        """Convenience method to get links and parse all posts."""
+        """Convenience method to get links and parse all posts concurrently."""
         post_urls = self.get_latest_post_links()
-        posts_data = []
-        for url in post_urls:
-            logger.info(f"Parsing post: {url}")
-            post_data = self.parse_post(url)
-            if post_data:
-                posts_data.append(post_data)
-            time.sleep(self.DELAY_BETWEEN_REQUESTS)
-        return posts_data
\ No newline at end of file
+        if not post_urls:
+            return []
+
+        # Every post in a batch shares the same pull date
+        date_pulled = datetime.now(_EASTERN).date().isoformat()
+
+        # Article fetches overlap on the shared session, paced by the throttle; results keep link order
+        with ThreadPoolExecutor(max_workers=min(len(post_urls), 8)) as executor:
+            results = list(executor.map(partial(self.parse_post, date_pulled=date_pulled), post_urls))
+        return [post_data for post_data in results if post_data]
\ No newline at end of file
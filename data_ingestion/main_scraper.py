@@ -3,9 +3,9 @@
 Main scraper runner script that coordinates all scrapers and sends data to Notion
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any
-import time
 
 # Import configuration and scrapers
 from config import *
@@ -37,8 +37,8 @@ class CyberSecurityScraper:
             'CrowdStrike': CrowdStrikeScraper(get_scraper_config('CrowdStrike'))
         }
     
-    def run_single_scraper(self, scraper_name: str) -> List[Dict[Any, Any]]:
-        """Run a single scraper and return its data"""
+    async def run_single_scraper(self, scraper_name: str) -> List[Dict[Any, Any]]:
+        """Run a single scraper in a worker thread and return its data"""
         if scraper_name not in self.scrapers:
             logger.error(f"Unknown scraper: {scraper_name}")
             return []
@@ -46,27 +46,38 @@ class CyberSecurityScraper:
         logger.info(f"Starting {scraper_name} scraper...")
         try:
             scraper = self.scrapers[scraper_name]
-            posts_data = scraper.scrape_all_posts()
+            posts_data = await asyncio.to_thread(scraper.scrape_all_posts)
             logger.info(f"{scraper_name} scraper completed. Found {len(posts_data)} posts.")
             return posts_data
         except Exception as e:
             logger.error(f"Error running {scraper_name} scraper: {e}")
             return []
     
-    def run_all_scrapers(self) -> List[Dict[Any, Any]]:
-        """Run all scrapers and collect all data"""
+    async def run_all_scrapers(self) -> List[Dict[Any, Any]]:
+        """Run all scrapers concurrently and collect all data"""
         all_posts = []
         
-        for scraper_name in self.scrapers.keys():
-            posts_data = self.run_single_scraper(scraper_name)
+        # Each scraper targets a different site, so they don't share rate limits;
+        # per-site politeness delays stay inside the individual scrapers
+        scraper_names = list(self.scrapers.keys())
+        tasks = [self.run_single_scraper(name) for name in scraper_names]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for scraper_name, posts_data in zip(scraper_names, results):
+            if isinstance(posts_data, Exception):
+                logger.error(f"Error running {scraper_name} scraper: {posts_data}")
+                continue
             all_posts.extend(posts_data)
-            
-            # Be respectful to websites
-            time.sleep(DELAY_BETWEEN_SCRAPERS)
         
         logger.info(f"All scrapers completed. Total posts collected: {len(all_posts)}")
         return all_posts
     
+    def close(self):
+        """Release connection pools held by scrapers that keep one open"""
+        for scraper in self.scrapers.values():
+            if hasattr(scraper, 'close'):
+                scraper.close()
+    
     def send_to_notion(self, posts_data: List[Dict[Any, Any]]):
         """Send scraped data to Notion database"""
         if not posts_data:
@@ -96,7 +107,7 @@ class CyberSecurityScraper:
         logger.info("Starting full cybersecurity scraping pipeline...")
         
         # Run all scrapers
-        all_posts = self.run_all_scrapers()
+        all_posts = asyncio.run(self.run_all_scrapers())
         
         if all_posts:
             # Send to Notion
@@ -113,11 +124,14 @@ def main():
         scraper = CyberSecurityScraper()
         
         # You can run individual scrapers like this:
-        # okta_posts = scraper.run_single_scraper('Okta')
+        # okta_posts = asyncio.run(scraper.run_single_scraper('Okta'))
         # scraper.send_to_notion(okta_posts)
         
         # Or run the full pipeline:
-        scraper.run_full_pipeline()
+        try:
+            scraper.run_full_pipeline()
+        finally:
+            scraper.close()
         
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
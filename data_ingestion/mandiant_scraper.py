@@ -1,14 +1,73 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from urllib.parse import urljoin
 from datetime import datetime
 import pytz
 import logging
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from throttle import RequestThrottle
 
 # Configure logger
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Blog index containers holding the featured and regular article links
+_FEATURED_CLASS = 'PcC8Zd nRhiJb-kR0ZEf-OWXEXe-GV1x9e-II5mzb nRhiJb-kR0ZEf-OWXEXe-GV1x9e-wNfPc-V2iZpe nRhiJb-snVHke-ibL1re-X66g3b nRhiJb-snVHke-R6PoUb-V2iZpe nRhiJb-kR0ZEf-OWXEXe-fW01td-AipIyc'
+_REGULAR_CLASS = 'MvKdV nRhiJb-DbgRPb-II5mzb-cGMI2b'
+# Only these containers are built into the index page tree
+_INDEX_STRAINER = SoupStrainer('div', class_=[_FEATURED_CLASS, _REGULAR_CLASS])
+
+# Links under this prefix are Google's own and not recorded as outbound
+_CLOUD_PREFIX = 'https://cloud.google.com'
+
+# Figure images carry a JcsBte class (substring match, as BS4 applies it per class value)
+_FIGURE_IMG_CLASS_RE = re.compile('JcsBte')
+
+# Images in the post's image containers, collected after the text content
+_FALLBACK_IMG_SELECTOR = 'div[class="JcsBte mZzdH ZOnyjc"] img'
+
+_EASTERN = pytz.timezone('US/Eastern')
+_DATE_FMT = '%B %d, %Y'
+
+# Content sections: unclassed or Wy08Ac/QzPuud sections that hold substantial content
+_CONTENT_SECTION = 'section:is(.Wy08Ac, .QzPuud, :not([class]), [class=""]):has(h2, h3, h4, p, figure, table, ul, ol)'
+_CONTENT_SECTIONS = sv.compile(_CONTENT_SECTION)
+_CHILD_CONTENT_SECTIONS = sv.compile(f':scope > {_CONTENT_SECTION}')
+# Elements rendered by process_text_content, in document order
+_ELEMENT_TAGS = frozenset({'h2', 'h3', 'h4', 'p', 'ul', 'ol', 'pre', 'code', 'table', 'figure'})
+
+# Inline tags given Markdown formatting in each context; other children render as plain text
+_PARAGRAPH_INLINE = frozenset({'img', 'a', 'strong', 'code'})
+_LIST_INLINE = frozenset({'a', 'code', 'strong'})
+_HEADER_INLINE = frozenset({'a'})
+_CELL_INLINE = frozenset({'a', 'code'})
+
+def _first_seen(text, processed_hashes):
+    """Record an 8-byte digest of the stripped text; False if it was already recorded"""
+    key = hashlib.blake2b(text.strip().encode(), digest_size=8).digest()
+    if key in processed_hashes:
+        return False
+    processed_hashes.add(key)
+    return True
+
+def _leading_text(element, limit):
+    """First `limit` characters of element.get_text(), without joining the whole subtree"""
+    parts = []
+    size = 0
+    for text in element.strings:
+        parts.append(text)
+        size += len(text)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
 class MandiantScraper:
     BASE_URL = "https://www.mandiant.com"
     BLOG_URL = "https://www.mandiant.com/resources/blog"
@@ -20,16 +79,45 @@ class MandiantScraper:
             self.MAX_POSTS = config.get('max_posts', 5)
             self.REQUEST_TIMEOUT = config.get('request_timeout', 10)
             self.DELAY_BETWEEN_REQUESTS = config.get('delay_between_requests', 1)
+            self.MAX_CONCURRENT_REQUESTS = config.get('max_concurrent_requests', 4)
         else:
             self.MAX_POSTS = 5
             self.REQUEST_TIMEOUT = 10
             self.DELAY_BETWEEN_REQUESTS = 1
+            self.MAX_CONCURRENT_REQUESTS = 4
+
+        # Concurrent fetches share a bounded, politely spaced set of request slots
+        self.throttle = RequestThrottle(self.MAX_CONCURRENT_REQUESTS, self.DELAY_BETWEEN_REQUESTS)
+
+        # Maps inline tag names to the handler that renders them as Markdown
+        self._inline_handlers = {
+            'img': self._inline_img,
+            'a': self._inline_link,
+            'strong': self._inline_strong,
+            'code': self._inline_code,
+        }
+
+        # Keep-alive pool sized for the concurrent post fetches, with retries on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # brotli (in requirements) lets urllib3 decode br responses
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'br, gzip'
+        })
 
     def fetch_page(self, url):
+        """Fetch a page as raw bytes; lxml decodes them using the document's declared charset"""
         try:
-            resp = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+            with self.throttle:
+                resp = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
             resp.raise_for_status()
-            return resp.text
+            return resp.content
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
@@ -40,11 +128,11 @@ class MandiantScraper:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', parse_only=_INDEX_STRAINER)
         blog_links = []
 
         # Get featured article link
-        featured_div = soup.find('div', class_='PcC8Zd nRhiJb-kR0ZEf-OWXEXe-GV1x9e-II5mzb nRhiJb-kR0ZEf-OWXEXe-GV1x9e-wNfPc-V2iZpe nRhiJb-snVHke-ibL1re-X66g3b nRhiJb-snVHke-R6PoUb-V2iZpe nRhiJb-kR0ZEf-OWXEXe-fW01td-AipIyc')
+        featured_div = soup.find('div', class_=_FEATURED_CLASS)
         if featured_div:
             featured_link = featured_div.find('a', href=True)
             if featured_link:
@@ -52,7 +140,7 @@ class MandiantScraper:
                 logger.info(f"Found featured article: {featured_link['href']}")
 
         # Get regular article links from the specified div
-        regular_articles_div = soup.find('div', class_='MvKdV nRhiJb-DbgRPb-II5mzb-cGMI2b')
+        regular_articles_div = soup.find('div', class_=_REGULAR_CLASS)
         if regular_articles_div:
             article_links = regular_articles_div.find_all('a', href=True, limit=4)
             for link in article_links:
@@ -67,175 +155,143 @@ class MandiantScraper:
         """Process text content from the article, organizing by H3 sections"""
         text_sections = []
         img_urls = []
+        seen_imgs = set()  # URLs already in img_urls
         outbound_links = []
-        processed_content = set()  # Track processed content for deduplication
+        processed_hashes = set()  # Digests of processed content for deduplication
 
         # Find the main content container
         main_content = soup.find('div', class_='OYL9D nRhiJb-kR0ZEf-OWXEXe-GV1x9e-OiUrBf')
         if not main_content:
             # Fallback to finding content sections directly
-            all_sections = soup.find_all(['section'])
+            content_sections = _CONTENT_SECTIONS.select(soup)
         else:
-            # Get all direct child sections from main content container
-            all_sections = main_content.find_all(['section'], recursive=False)
+            # Get direct child content sections from main content container
+            content_sections = _CHILD_CONTENT_SECTIONS.select(main_content)
 
         # Let's specifically look for QzPuud sections anywhere in the document
         qzpuud_sections = soup.find_all('section', class_='QzPuud')
 
-        # Filter to content sections (skip author section which is typically first)
-        content_sections = []
-        for section in all_sections:
-            # Look for sections that contain substantial content
-            has_content = section.find(['h2', 'h3', 'h4', 'p', 'figure', 'table', 'ul', 'ol'])
-            section_classes = section.get('class', [])
-
-            if (has_content and
-                (not section_classes or
-                 any(cls in section_classes for cls in ['Wy08Ac', 'QzPuud']) or
-                 'QzPuud' in str(section_classes))):
-                content_sections.append(section)
-
         # Skip the first section if it looks like an author section
-        if content_sections and content_sections[0].find('p') and 'written by' in content_sections[0].get_text().lower()[:100]:
+        if content_sections and content_sections[0].find('p') and 'written by' in _leading_text(content_sections[0], 100).lower():
             content_sections = content_sections[1:]
 
         # TEMPORARY FIX: If we found QzPuud sections but they're not in content_sections, add them
-        if qzpuud_sections and not any('QzPuud' in str(s.get('class', [])) for s in content_sections):
+        if qzpuud_sections and not any('QzPuud' in s.get('class', ()) for s in content_sections):
             content_sections.extend(qzpuud_sections)
 
-        section_text = ""
+        section_parts = []
 
         for section in content_sections:
-            section_copy = section.__copy__()
+            # Stream content elements in document order (text nodes have no name)
+            elements = (node for node in section.descendants if node.name in _ELEMENT_TAGS)
 
-            # Process all content elements in document order
-            elements = section_copy.find_all(['h2', 'h3', 'h4', 'p', 'ul', 'ol', 'pre', 'code', 'table', 'figure'], recursive=True)
+            # Everything inside a figure is rendered by process_figure
+            in_figure = {id(node) for figure in section.find_all('figure') for node in figure.descendants}
 
             for element in elements:
                 # Skip if this element is inside a figure that we'll process separately
-                if element.find_parent('figure') and element.name != 'figure':
+                if element.name != 'figure' and id(element) in in_figure:
                     continue
 
                 if element.name in ['h2', 'h3']:
                     # If we have accumulated text, save the current section
-                    if section_text.strip():
-                        text_sections.append(section_text.strip())
+                    section_text = "".join(section_parts).strip()
+                    if section_text:
+                        text_sections.append(section_text)
 
                     # Start new section with heading
                     heading_text = element.get_text(separator=' ').strip()
-                    if heading_text not in processed_content:
-                        processed_content.add(heading_text)
-                        section_text = f"## {heading_text}\n"
+                    if _first_seen(heading_text, processed_hashes):
+                        section_parts = [f"## {heading_text}\n"]
                     else:
-                        section_text = ""
+                        section_parts = []
 
                 elif element.name == 'h4':
                     heading_text = element.get_text(separator=' ').strip()
-                    if heading_text not in processed_content:
-                        processed_content.add(heading_text)
-                        section_text += f"**{heading_text}**\n"
+                    if _first_seen(heading_text, processed_hashes):
+                        section_parts.append(f"**{heading_text}**\n")
 
                 elif element.name == 'p':
-                    paragraph_text = self.process_paragraph(element, img_urls, outbound_links)
-                    if paragraph_text.strip() and paragraph_text not in processed_content:
-                        processed_content.add(paragraph_text.strip())
-                        section_text += f"{paragraph_text}\n"
+                    paragraph_text = self.process_paragraph(element, img_urls, seen_imgs, outbound_links)
+                    if paragraph_text.strip() and _first_seen(paragraph_text, processed_hashes):
+                        section_parts.append(f"{paragraph_text}\n")
 
                 elif element.name in ['ul', 'ol']:
                     list_text = self.process_list(element, outbound_links)
-                    if list_text.strip() and list_text not in processed_content:
-                        processed_content.add(list_text.strip())
-                        section_text += f"{list_text}\n"
+                    if list_text.strip() and _first_seen(list_text, processed_hashes):
+                        section_parts.append(f"{list_text}\n")
 
                 elif element.name == 'pre':
                     code_text = self.process_code_block(element)
-                    if code_text.strip() and code_text not in processed_content:
-                        processed_content.add(code_text.strip())
-                        section_text += f"{code_text}\n"
+                    if code_text.strip() and _first_seen(code_text, processed_hashes):
+                        section_parts.append(f"{code_text}\n")
 
                 elif element.name == 'code' and element.parent.name != 'pre':
                     # Handle inline code
                     code_text = element.get_text(separator=' ').strip()
-                    if code_text and f"`{code_text}`" not in processed_content:
-                        processed_content.add(f"`{code_text}`")
-                        section_text += f"`{code_text}`"
+                    if code_text and _first_seen(f"`{code_text}`", processed_hashes):
+                        section_parts.append(f"`{code_text}`")
 
                 elif element.name == 'table':
                     table_text = self.process_table(element, outbound_links)
-                    if table_text.strip() and table_text not in processed_content:
-                        processed_content.add(table_text.strip())
-                        section_text += f"{table_text}\n"
+                    if table_text.strip() and _first_seen(table_text, processed_hashes):
+                        section_parts.append(f"{table_text}\n")
 
                 elif element.name == 'figure':
-                    figure_text = self.process_figure(element, img_urls, outbound_links)
-                    if figure_text.strip() and figure_text not in processed_content:
-                        processed_content.add(figure_text.strip())
-                        section_text += f"{figure_text}\n"
+                    figure_text = self.process_figure(element, img_urls, seen_imgs, outbound_links)
+                    if figure_text.strip() and _first_seen(figure_text, processed_hashes):
+                        section_parts.append(f"{figure_text}\n")
 
         # Add the final section if it has content
-        if section_text.strip():
-            text_sections.append(section_text.strip())
+        section_text = "".join(section_parts).strip()
+        if section_text:
+            text_sections.append(section_text)
 
         return text_sections, img_urls, outbound_links
 
-    def process_paragraph(self, p_element, img_urls, outbound_links):
-        """Process a paragraph element, handling inline images and links"""
-        text = ""
-
-        for element in p_element.children:
-            if hasattr(element, 'name'):
-                if element.name == 'img':
-                    # Process image
-                    img_url = self.process_image(element)
-                    if img_url:
-                        img_urls.append({"img_url": img_url, "alt_text": element.get('alt', 'image')})
-                        alt_text = element.get('alt', 'image')
-                        text += f"![{alt_text}]({img_url})"
-
-                elif element.name == 'a':
-                    # Process link
-                    link_text, link_url = self.process_link(element, outbound_links)
-                    text += f"[{link_text}]({link_url})"
-
-                elif element.name == 'strong':
-                    text += f"**{element.get_text(separator=' ')}**"
-
-                elif element.name == 'code':
-                    text += f"`{element.get_text(separator=' ')}`"
-
-                else:
-                    text += element.get_text(separator=' ')
+    def render_inline(self, parent, inline_tags, outbound_links, img_urls=None, seen_imgs=None):
+        """Render an element's children as Markdown, formatting the tags in inline_tags"""
+        parts = []
+        for element in parent.children:
+            name = element.name  # None for text nodes
+            if name in inline_tags:
+                parts.append(self._inline_handlers[name](element, outbound_links, img_urls, seen_imgs))
             else:
-                # Text node
-                text += str(element)
+                parts.append(element.get_text(separator=' '))
+        return "".join(parts)
+
+    def _inline_img(self, element, outbound_links, img_urls, seen_imgs):
+        img_url = self.process_image(element)
+        if not img_url:
+            return ""
+        alt_text = element.get('alt', 'image')
+        self.add_image(img_url, alt_text, img_urls, seen_imgs)
+        return f"![{alt_text}]({img_url})"
+
+    def _inline_link(self, element, outbound_links, img_urls, seen_imgs):
+        link_text, link_url = self.process_link(element, outbound_links)
+        return f"[{link_text}]({link_url})"
+
+    def _inline_strong(self, element, outbound_links, img_urls, seen_imgs):
+        return f"**{element.get_text(separator=' ')}**"
 
-        return text.strip()
+    def _inline_code(self, element, outbound_links, img_urls, seen_imgs):
+        return f"`{element.get_text(separator=' ')}`"
+
+    def process_paragraph(self, p_element, img_urls, seen_imgs, outbound_links):
+        """Process a paragraph element, handling inline images and links"""
+        return self.render_inline(p_element, _PARAGRAPH_INLINE, outbound_links, img_urls, seen_imgs).strip()
 
     def process_list(self, list_element, outbound_links):
         """Process ul/ol elements into bullet points"""
-        list_text = ""
+        list_items = []
 
         for li in list_element.find_all('li', recursive=False):
-            li_text = ""
-
-            for element in li.children:
-                if hasattr(element, 'name'):
-                    if element.name == 'a':
-                        link_text, link_url = self.process_link(element, outbound_links)
-                        li_text += f"[{link_text}]({link_url})"
-                    elif element.name == 'code':
-                        li_text += f"`{element.get_text(separator=' ')}`"
-                    elif element.name == 'strong':
-                        li_text += f"**{element.get_text(separator=' ')}**"
-                    else:
-                        li_text += element.get_text(separator=' ')
-                else:
-                    li_text += str(element)
+            li_text = self.render_inline(li, _LIST_INLINE, outbound_links).strip()
+            if li_text:
+                list_items.append(f"• {li_text}\n")
 
-            if li_text.strip():
-                list_text += f"• {li_text.strip()}\n"
-
-        return list_text
+        return "".join(list_items)
 
     def process_code_block(self, pre_element):
         """Process pre/code blocks into markdown code blocks"""
@@ -249,87 +305,78 @@ class MandiantScraper:
 
     def process_table(self, table_element, outbound_links):
         """Process HTML table into markdown table format"""
-        table_text = ""
         rows = table_element.find_all('tr')
 
         if not rows:
             return ""
 
+        table_lines = []
+
         # Process header row
         header_row = rows[0]
         headers = []
         for th in header_row.find_all(['th', 'td']):
-            header_text = ""
-            for element in th.children:
-                if hasattr(element, 'name'):
-                    if element.name == 'a':
-                        link_text, link_url = self.process_link(element, outbound_links)
-                        header_text += f"[{link_text}]({link_url})"
-                    else:
-                        header_text += element.get_text(separator=' ')
-                else:
-                    header_text += str(element)
-            headers.append(header_text.strip())
+            headers.append(self.render_inline(th, _HEADER_INLINE, outbound_links).strip())
 
         if headers:
-            table_text += "| " + " | ".join(headers) + " |\n"
-            table_text += "|" + "|".join(["-" * (len(h) + 2) for h in headers]) + "|\n"
+            table_lines.append("| " + " | ".join(headers) + " |\n")
+            table_lines.append("|" + "|".join(["-" * (len(h) + 2) for h in headers]) + "|\n")
 
         # Process data rows
         for row in rows[1:]:
             cells = []
             for td in row.find_all(['td', 'th']):
-                cell_text = ""
-                for element in td.children:
-                    if hasattr(element, 'name'):
-                        if element.name == 'a':
-                            link_text, link_url = self.process_link(element, outbound_links)
-                            cell_text += f"[{link_text}]({link_url})"
-                        elif element.name == 'code':
-                            cell_text += f"`{element.get_text(separator=' ')}`"
-                        else:
-                            cell_text += element.get_text(separator=' ')
-                    else:
-                        cell_text += str(element)
-                cells.append(cell_text.strip())
+                cells.append(self.render_inline(td, _CELL_INLINE, outbound_links).strip())
 
             if cells:
-                table_text += "| " + " | ".join(cells) + " |\n"
+                table_lines.append("| " + " | ".join(cells) + " |\n")
 
-        return table_text
+        return "".join(table_lines)
 
-    def process_figure(self, figure_element, img_urls, outbound_links):
+    def process_figure(self, figure_element, img_urls, seen_imgs, outbound_links):
         """Process figure elements containing images and captions"""
-        figure_text = ""
+        figure_parts = []
 
-        # Find images in the figure (avoid duplicates by checking the first one)
-        img_tags = figure_element.find_all('img', class_=lambda x: x and 'JcsBte' in x)
+        # Use only the first image to avoid duplicates from modal
+        img = figure_element.find('img', class_=_FIGURE_IMG_CLASS_RE)
 
-        if img_tags:
-            # Use only the first image to avoid duplicates from modal
-            img = img_tags[0]
+        if img:
             img_url = self.process_image(img)
-            if img_url and not any(item["img_url"] == img_url for item in img_urls):
+            if img_url and img_url not in seen_imgs:
                 alt_text = img.get('alt', 'image')
-                img_urls.append({"img_url": img_url, "alt_text": alt_text})
-                figure_text += f"![{alt_text}]({img_url})\n"
+                self.add_image(img_url, alt_text, img_urls, seen_imgs)
+                figure_parts.append(f"![{alt_text}]({img_url})\n")
 
         # Find caption
         caption_p = figure_element.find('p')
         if caption_p:
-            caption_text = self.process_paragraph(caption_p, [], outbound_links)
+            caption_text = self.process_paragraph(caption_p, [], set(), outbound_links)
             if caption_text.strip():
-                figure_text += f"*{caption_text}*\n"
+                figure_parts.append(f"*{caption_text}*\n")
 
-        return figure_text
+        return "".join(figure_parts)
 
     def process_image(self, img_element):
         """Process image element and return absolute URL"""
         img_src = img_element.get('src') or img_element.get('data-src')
         if img_src:
-            return urljoin(self.BASE_URL, img_src)
+            return self._absolutize(img_src)
         return None
 
+    def _absolutize(self, href):
+        """Resolve href against BASE_URL, skipping urljoin for absolute and plain root-relative URLs"""
+        if href.startswith(('https://', 'http://')):
+            return href
+        if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+            return self.BASE_URL + href
+        return urljoin(self.BASE_URL, href)
+
+    def add_image(self, img_url, alt_text, img_urls, seen_imgs):
+        """Append an image to img_urls unless its URL was already collected"""
+        if img_url not in seen_imgs:
+            seen_imgs.add(img_url)
+            img_urls.append({"img_url": img_url, "alt_text": alt_text})
+
     def process_link(self, a_element, outbound_links):
         """Process link element and categorize it"""
         link_text = a_element.get_text(separator=' ').strip()
@@ -337,24 +384,24 @@ class MandiantScraper:
 
         if link_url:
             # Convert to absolute URL
-            absolute_url = urljoin(self.BASE_URL, link_url)
+            absolute_url = self._absolutize(link_url)
 
             # Check if it's an outbound link
-            if not absolute_url.startswith('https://cloud.google.com'):
+            if not absolute_url.startswith(_CLOUD_PREFIX):
                 outbound_links.append(absolute_url)
 
             return link_text, absolute_url
 
         return link_text, link_url
 
-    def parse_post(self, webpage_url):
+    def parse_post(self, webpage_url, date_pulled=None):
         """Extract title, date, text, images, and outbound links from a Mandiant blog post"""
-
+        logger.info(f"Parsing post: {webpage_url}")
         html = self.fetch_page(webpage_url)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Extract title
         title_tag = soup.find('div', class_='Qwf2Db-MnozTc Qwf2Db-MnozTc-OWXEXe-MnozTc-ibL1re')
@@ -373,27 +420,24 @@ class MandiantScraper:
             date_text = date_tag.get_text(separator=' ').strip()
             try:
                 # Convert "August 26, 2025" format to "2025-08-26"
-                dt_object = datetime.strptime(date_text, "%B %d, %Y")
+                dt_object = datetime.strptime(date_text, _DATE_FMT)
                 date_published = dt_object.strftime("%Y-%m-%d")
             except ValueError:
                 date_published = None
 
-        # Get current date in Eastern timezone
-        eastern = pytz.timezone('US/Eastern')
-        date_pulled = datetime.now(eastern).date().isoformat()
+        # Get current date in Eastern timezone unless the batch already did
+        if date_pulled is None:
+            date_pulled = datetime.now(_EASTERN).date().isoformat()
 
         # Process text content
         text_content, img_urls, outbound_links = self.process_text_content(soup)
 
         # Extract images from specific class (fallback)
-        img_divs = soup.find_all('div', class_='JcsBte mZzdH ZOnyjc')
-        for img_div in img_divs:
-            img_tags = img_div.find_all('img')
-            for img in img_tags:
-                img_url = self.process_image(img)
-                if img_url and not any(item["img_url"] == img_url for item in img_urls):
-                    alt_text = img.get('alt', 'image')
-                    img_urls.append({"img_url": img_url, "alt_text": alt_text})
+        seen_imgs = {item["img_url"] for item in img_urls}
+        for img in soup.select(_FALLBACK_IMG_SELECTOR):
+            img_url = self.process_image(img)
+            if img_url:
+                self.add_image(img_url, img.get('alt', 'image'), img_urls, seen_imgs)
 
         post_data = {
             "company": self.DOMAIN,
@@ -409,14 +453,15 @@ class MandiantScraper:
         return post_data
 
     def scrape_all_posts(self):
-        """Convenience method to get links and parse all posts"""
+        """Convenience method to get links and parse all posts concurrently"""
         post_urls = self.get_latest_post_links()
-        posts_data = []
+        if not post_urls:
+            return []
 
-        for url in post_urls:
-            logger.info(f"Parsing post: {url}")
-            post_data = self.parse_post(url)
-            if post_data:
-                posts_data.append(post_data)
+        # Every post in a batch shares the same pull date
+        date_pulled = datetime.now(_EASTERN).date().isoformat()
 
-        return posts_data
\ No newline at end of file
+        # Article fetches overlap on the shared session; results keep link order
+        with ThreadPoolExecutor(max_workers=min(len(post_urls), 8)) as executor:
+            results = list(executor.map(partial(self.parse_post, date_pulled=date_pulled), post_urls))
+        return [post_data for post_data in results if post_data]
\ No newline at end of file
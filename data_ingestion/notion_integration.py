@@ -1,93 +1,113 @@
 """Notion database integration module"""
 import os
+import asyncio
 import notion_client
 import re
 import json
 import unicodedata
+from functools import lru_cache
+
+# Markdown patterns used when converting scraped text to Notion blocks
+_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\((.*?)\)')
+# Applied with match() from an offset, so the pattern itself isn't anchored
+_HEADING_RE = re.compile(r'(#{1,6})\s+(.*)')
+_NON_SPACE_RE = re.compile(r'\S')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# Dates Notion accepts in a date filter; scrapers fall back to raw strings when parsing fails
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Space-like and invisible characters that break Notion links; add others here if needed
+_BAD_UNICODE_RE = re.compile(
+    "["
+    "\u202f"  # narrow no-break space
+    "\u200b"  # zero-width space
+    "\ufeff"  # BOM
+    "\u200e"  # LTR mark
+    "\u200f"  # RTL mark
+    "\u2060"  # word joiner
+    "\u00a0"  # non-breaking space
+    "\u3000"  # ideographic space
+    "]"
+)
 
 def has_bad_unicode(url: str) -> bool:
     """Check if URL contains disallowed unicode characters (breaking Notion links)."""
     if not url:
         return False
-    # Add other space-like or invisible characters if needed
-    bad_chars = [
-        "\u202f",  # narrow no-break space
-        "\u200b",  # zero-width space
-        "\ufeff",  # BOM
-        "\u200e",  # LTR mark
-        "\u200f",  # RTL mark
-        "\u2060",  # word joiner
-        "\u00a0",  # non-breaking space
-        "\u3000",  # ideographic space
-    ]
-    return any(c in url for c in bad_chars)
+    return _BAD_UNICODE_RE.search(url) is not None
 
+@lru_cache(maxsize=4096)
 def sanitize_url(url: str) -> str:
-    """Clean URL: normalize, remove bad unicode, and drop invalid ones."""
+    """Clean URL: normalize, remove bad unicode, and drop invalid ones (cached; the drop warning prints once per URL)."""
     if not url or has_bad_unicode(url):
         print(f"⚠️ Dropping bad URL: {url}")
         return ""
-    url = unicodedata.normalize("NFC", url.strip())
+    url = url.strip()
+    # ASCII is already NFC; only normalize URLs that contain other characters
+    if not url.isascii():
+        url = unicodedata.normalize("NFC", url)
     if not url.startswith(("http://", "https://")):
         url = "https://" + url.lstrip("/")
     return url
 
-def check_page_exists(notion_client, database_id, title, date_published):
-    """Checks if a page with the same title and date published already exists."""
-    try:
-        # Search for pages with the matching title
-        filter_title = {
-            "property": "Title",
-            "title": {
-                "equals": title
-            }
-        }
-        
-        # Search for pages with the matching date published
-        filter_date = {
-            "property": "Date Published",
-            "date": {
-                "equals": date_published
-            }
+def get_existing_pages(notion_client, database_id, dates_published):
+    """
+    Returns the (title, date published) pairs already in the database for the given dates.
+
+    Only ISO dates go into the filter, since one value Notion can't parse fails the whole
+    query. Posts with other dates are treated as not found, as the per-post check was.
+    """
+    existing = set()
+    dates = sorted(d for d in set(dates_published) if d and _ISO_DATE_RE.fullmatch(d))
+    # Notion caps compound filters at 100 conditions
+    for i in range(0, len(dates), 100):
+        date_filter = {
+            "or": [{"property": "Date Published", "date": {"equals": d}} for d in dates[i:i + 100]]
         }
-        
-        # Combine filters to check for both title and date
-        search_results = notion_client.databases.query(
-            database_id=database_id,
-            filter={
-                "and": [filter_title, filter_date]
-            }
-        )
-        
-        return len(search_results['results']) > 0
-    except Exception as e:
-        print(f"Error checking for existing page: {e}")
-        return False
+        # A failed chunk only loses its own dates, not the rest of the batch
+        try:
+            cursor = None
+            while True:
+                query = {"database_id": database_id, "filter": date_filter, "page_size": 100}
+                if cursor:
+                    query["start_cursor"] = cursor
+                search_results = notion_client.databases.query(**query)
+
+                for page in search_results['results']:
+                    properties = page['properties']
+                    title = "".join(t['plain_text'] for t in properties['Title']['title'])
+                    date = properties['Date Published']['date']
+                    existing.add((title, date['start'] if date else None))
+
+                if not search_results.get('has_more'):
+                    break
+                cursor = search_results['next_cursor']
+        except Exception as e:
+            print(f"Error checking for existing pages: {e}")
+    return existing
+
+def _iter_chunks(text, size=1900):
+    """Yields consecutive slices of text at most `size` characters long."""
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+def _emit_text(rich_text, text):
+    """Appends plain text as rich-text runs short enough for Notion's 2000-character limit."""
+    rich_text.extend({"text": {"content": chunk}} for chunk in _iter_chunks(text))
 
 def markdown_to_notion_blocks(markdown_list):
     blocks = []
-    image_regex = r'!\[([^\]]*)\]\((.*?)\)'
-    heading_regex = r'^(#{1,6})\s+(.*)'
-    link_regex = r'\[([^\]]+)\]\(([^)]+)\)'
 
     def parse_rich_text_with_links(text):
         rich_text = []
         last_end = 0
         
-        for match in re.finditer(link_regex, text):
+        for match in _LINK_RE.finditer(text):
             start, end = match.span()
             link_text, link_url = match.group(1), match.group(2)
             
             if start > last_end:
-                before_text = text[last_end:start]
-                if before_text:
-                    # Chunk text that's too long
-                    if len(before_text) > 1900:
-                        chunks = [before_text[i:i+1900] for i in range(0, len(before_text), 1900)]
-                        for chunk in chunks:
-                            rich_text.append({"text": {"content": chunk}})
-                    else:
-                        rich_text.append({"text": {"content": before_text}})
+                _emit_text(rich_text, text[last_end:start])
             
             # Ensure link text isn't too long
             if len(link_text) > 1900:
@@ -99,46 +119,38 @@ def markdown_to_notion_blocks(markdown_list):
             last_end = end
         
         if last_end < len(text):
-            remaining_text = text[last_end:]
-            if remaining_text:
-                # Chunk remaining text
-                if len(remaining_text) > 1900:
-                    chunks = [remaining_text[i:i+1900] for i in range(0, len(remaining_text), 1900)]
-                    for chunk in chunks:
-                        rich_text.append({"text": {"content": chunk}})
-                else:
-                    rich_text.append({"text": {"content": remaining_text}})
+            _emit_text(rich_text, text[last_end:])
         
         if not rich_text:
-            # Handle case where original text is too long
-            if len(text) > 1900:
-                chunks = [text[i:i+1900] for i in range(0, len(text), 1900)]
-                for chunk in chunks:
-                    rich_text.append({"text": {"content": chunk}})
-            else:
-                rich_text = [{"text": {"content": text}}]
+            # Empty text still needs one (empty) run
+            rich_text = [{"text": {"content": text}}]
         
         return rich_text
 
+    def append_paragraphs(text):
+        if not text.strip():
+            return
+        for chunk in _iter_chunks(text, 2000):
+            blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": parse_rich_text_with_links(chunk)}})
+
     for item in markdown_list:
-        remaining_text = item
-        
-        while remaining_text:
-            # Check for an image at the current position
-            image_match = re.search(image_regex, remaining_text)
-            
-            # Check for a heading at the current position
-            heading_match = re.match(heading_regex, remaining_text.strip())
-            
+        # Walk the item with a cursor instead of re-slicing and re-stripping the
+        # remaining text after every image, so each item is scanned once
+        pos = 0
+        content_end = len(item.rstrip())
+        image_matches = _IMAGE_RE.finditer(item)
+
+        while pos < len(item):
             # Priority: Heading, then Image, then Paragraph
-            
+            first_char = _NON_SPACE_RE.search(item, pos, content_end)
+            heading_match = _HEADING_RE.match(item, first_char.start(), content_end) if first_char else None
+
             if heading_match:
                 # Process heading first
                 heading_text = heading_match.group(2).strip()
-                heading_end = heading_match.end()
-                
+
                 # Check for remaining text after the heading on the same line
-                body_text = remaining_text[heading_end:].strip()
+                body_text = item[heading_match.end():].strip()
                 
                 heading_rich_text = parse_rich_text_with_links(heading_text)
                 for t in heading_rich_text:
@@ -156,18 +168,12 @@ def markdown_to_notion_blocks(markdown_list):
                 else:
                     blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": heading_rich_text}})
                 
-                remaining_text = "" # Processed the whole item as a heading
-                
-            elif image_match:
+                break # Processed the whole item as a heading
+
+            image_match = next(image_matches, None)
+            if image_match:
                 # Process text before the image
-                pre_image_text = remaining_text[:image_match.start()]
-                if pre_image_text.strip():
-                    if len(pre_image_text) > 2000:
-                        chunks = [pre_image_text[i:i+2000] for i in range(0, len(pre_image_text), 2000)]
-                        for chunk in chunks:
-                            blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": parse_rich_text_with_links(chunk)}})
-                    else:
-                        blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": parse_rich_text_with_links(pre_image_text)}})
+                append_paragraphs(item[pos:image_match.start()])
                 
                 # Process the image block
                 alt_text, image_url = image_match.group(1), image_match.group(2)
@@ -183,24 +189,20 @@ def markdown_to_notion_blocks(markdown_list):
                         }
                     })
                 
-                # Update the remaining text to continue processing after the image
-                remaining_text = remaining_text[image_match.end():]
+                # Continue processing after the image
+                pos = image_match.end()
                 
             else:
                 # Process as a regular paragraph
-                if remaining_text.strip():
-                    if len(remaining_text) > 2000:
-                        chunks = [remaining_text[i:i+2000] for i in range(0, len(remaining_text), 2000)]
-                        for chunk in chunks:
-                            blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": parse_rich_text_with_links(chunk)}})
-                    else:
-                        blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": parse_rich_text_with_links(remaining_text)}})
-                
-                remaining_text = "" # Processed the whole item as a paragraph
+                append_paragraphs(item[pos:])
+                break # Processed the whole item as a paragraph
                 
     return blocks
 
-def truncate_filename(text, max_length=100):
+# Longest name given to an entry in the Image URLs files property
+FILE_NAME_MAX_LENGTH = 100
+
+def truncate_filename(text, max_length=FILE_NAME_MAX_LENGTH):
     if len(text) <= max_length:
         return text
     truncated = text[:max_length]
@@ -209,8 +211,71 @@ def truncate_filename(text, max_length=100):
         return truncated[:last_space] + "..."
     return truncated[:max_length-3] + "..."
 
+# Notion allows ~3 requests/s per integration: keep at most this many page creates
+# in flight, and start them no faster than that rate
+NOTION_MAX_CONCURRENCY = 3
+NOTION_REQUESTS_PER_SECOND = 3
+# Notion accepts at most this many child blocks per create/append request
+NOTION_MAX_BLOCKS_PER_REQUEST = 100
+
+async def create_notion_pages_async(pages, notion_api_key, database_id):
+    """Creates prepared (title, properties, children) pages concurrently in the given database."""
+    semaphore = asyncio.Semaphore(NOTION_MAX_CONCURRENCY)
+    pacing_lock = asyncio.Lock()
+    interval = 1 / NOTION_REQUESTS_PER_SECOND
+    next_start = 0.0
+
+    async def wait_for_turn():
+        """Spaces request starts `interval` apart across all workers."""
+        nonlocal next_start
+        async with pacing_lock:
+            loop_time = asyncio.get_running_loop().time()
+            if next_start > loop_time:
+                await asyncio.sleep(next_start - loop_time)
+            next_start = max(next_start, loop_time) + interval
+
+    async with notion_client.AsyncClient(auth=notion_api_key) as notion:
+        async def create_one(title, properties, children_blocks):
+            async with semaphore:
+                await wait_for_turn()
+                try:
+                    page = await notion.pages.create(
+                        parent={"database_id": database_id},
+                        properties=properties,
+                        children=children_blocks[:NOTION_MAX_BLOCKS_PER_REQUEST]
+                    )
+                except Exception as e:
+                    print(f"Failed to create page for '{title}': {e}")
+                    return
+                try:
+                    # Appends to one page must land in order, so the rest go one batch at a time
+                    for start in range(NOTION_MAX_BLOCKS_PER_REQUEST, len(children_blocks), NOTION_MAX_BLOCKS_PER_REQUEST):
+                        await wait_for_turn()
+                        await notion.blocks.children.append(
+                            block_id=page["id"],
+                            children=children_blocks[start:start + NOTION_MAX_BLOCKS_PER_REQUEST]
+                        )
+                except Exception as e:
+                    # A truncated page would pass the existence check on later runs and never be completed
+                    print(f"Failed to add content to page '{title}' ({page['id']}): {e}")
+                    try:
+                        await wait_for_turn()
+                        await notion.pages.update(page_id=page["id"], archived=True)
+                        print(f"Archived incomplete page '{title}' ({page['id']}).")
+                    except Exception as archive_error:
+                        print(f"Failed to archive incomplete page '{title}' ({page['id']}), remove it by hand: {archive_error}")
+                    return
+                print(f"Page '{title}' created successfully.")
+
+        await asyncio.gather(*(create_one(*page) for page in pages))
+
+@lru_cache(maxsize=4)
+def _get_notion(notion_api_key):
+    """Shared sync client per API key, so repeated ingests reuse its connection pool."""
+    return notion_client.Client(auth=notion_api_key)
+
 def create_notion_database_and_pages(data_list, notion_api_key, parent_page_id, database_name):
-    notion = notion_client.Client(auth=notion_api_key)
+    notion = _get_notion(notion_api_key)
     try:
         search_results = notion.search(query=database_name, filter={"property": "object", "value": "database"})
         database_id = None
@@ -244,11 +309,18 @@ def create_notion_database_and_pages(data_list, notion_api_key, parent_page_id,
         print(f"Database creation/search error: {e}")
         return {"error": str(e)}
 
+    # One query for every page already stored on the batch's publish dates
+    existing = get_existing_pages(notion, database_id, (item.get('date_published') for item in data_list))
+
+    # Build every page up front, then submit the creates concurrently
+    pages = []
     for item in data_list:
         try:
-            if check_page_exists(notion, database_id, item['title'], item['date_published']):
+            page_key = (item['title'], item['date_published'])
+            if page_key in existing:
                 print(f"Page '{item['title']}' already exists. Skipping.")
                 continue  # Skip to the next item in the loop
+            existing.add(page_key)
 
             has_outbound_links = bool(item.get('outbound_links') and any(link.strip() for link in item['outbound_links']))
             valid_images = [
@@ -256,16 +328,20 @@ def create_notion_database_and_pages(data_list, notion_api_key, parent_page_id,
                 for img in item.get('img_urls', [])
                 if (clean_url := sanitize_url(img.get('img_url')))
             ]
+            image_files = []
+            for img in valid_images:
+                name = img['alt_text']
+                # Most alt texts are short, so skip the call unless truncation is needed
+                if len(name) > FILE_NAME_MAX_LENGTH:
+                    name = truncate_filename(name)
+                image_files.append({"type": "external", "name": name, "external": {"url": img['img_url']}})
             properties = {
                 "Title": {"title": [{"text": {"content": item['title']}}]},
                 "Company": {"rich_text": [{"text": {"content": item['company']}}]},
                 "Date Published": {"date": {"start": item['date_published']}},
                 "Date Pulled": {"date": {"start": item['date_pulled']}},
                 "Webpage URL": {"url": item['webpage_url']},
-                "Image URLs": {"files": [
-                    {"type": "external", "name": truncate_filename(img['alt_text']), "external": {"url": img['img_url']}}
-                    for img in valid_images
-                ]},
+                "Image URLs": {"files": image_files},
                 "Outbound Links?": {"rich_text": [{"text": {"content": "Yes" if has_outbound_links else "No"}}]}
             }
             children_blocks = markdown_to_notion_blocks(item.get('text_content', []))
@@ -273,11 +349,13 @@ def create_notion_database_and_pages(data_list, notion_api_key, parent_page_id,
                 outbound_links_text = "Outbound Links:\n" + "\n".join(item['outbound_links'])
                 children_blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": outbound_links_text}}]}})
 
-            notion.pages.create(parent={"database_id": database_id}, properties=properties, children=children_blocks)
-            print(f"Page '{item['title']}' created successfully.")
+            pages.append((item['title'], properties, children_blocks))
 
         except Exception as e:
-            print(f"Failed to create page for '{item.get('title', 'Unknown')}': {e}")
+            print(f"Failed to prepare page for '{item.get('title', 'Unknown')}': {e}")
             continue
 
+    if pages:
+        asyncio.run(create_notion_pages_async(pages, notion_api_key, database_id))
+
     return {"status": "success", "database_id": database_id}
\ No newline at end of file
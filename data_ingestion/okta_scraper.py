@@ -1,20 +1,126 @@
 #!/usr/bin/env python3
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from urllib.parse import urljoin
-from datetime import datetime
+from datetime import datetime, date
+import calendar
+import re
 import pytz
 import logging
 import json
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+from post_cache import PostCache
+from throttle import RequestThrottle
 
 # Configure logger
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+_EASTERN = pytz.timezone('US/Eastern')
+
+# Publication dates are matched against fixed patterns and a month table instead of strptime
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_BLOG_DATE_RE = re.compile(r'(?P<month>[A-Za-z]+)\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})')  # March 5, 2024
+_NEWSROOM_DATE_RE = re.compile(r'(?P<day>\d{1,2})\s+(?P<month>[A-Za-z]+)\s+(?P<year>\d{4})')  # 05 March 2024
+
+def _iso_date(pattern, date_text):
+    """ISO date for text matching one of the date patterns; raises ValueError otherwise"""
+    match = pattern.fullmatch(date_text)
+    if not match:
+        raise ValueError(f"unrecognized date format: {date_text!r}")
+    month = _MONTHS.get(match['month'].lower())
+    if month is None:
+        raise ValueError(f"unknown month: {match['month']!r}")
+    return date(int(match['year']), month, int(match['day'])).isoformat()
+
+# Post links on the blog index, in priority order: teaser titles first, then any
+# blog or newsroom article link
+_POST_LINK_PATTERNS = [
+    sv.compile("h2.BlogTeaser__title a[href]"),
+    sv.compile("a[href*='/blog/']"),
+    sv.compile("a[href*='/newsroom/articles/']"),
+]
+_POST_LINKS = sv.compile(", ".join(pattern.pattern for pattern in _POST_LINK_PATTERNS))
+
+def _class_token_re(*class_names):
+    """Matches a class attribute containing any of the names as a whole token"""
+    return re.compile(r'(?:^|\s)(?:%s)(?:\s|$)' % '|'.join(map(re.escape, class_names)))
+
+# Only the title, date and article body are built into each post's tree. The
+# strainers see the raw class attribute, so they match on single class tokens.
+_NEWSROOM_TITLE_CLASS = "cmp-hero__title"
+_NEWSROOM_DATE_CLASS = "cmp-hero__release-date__content"
+_NEWSROOM_CONTENT_CLASS = "container responsivegrid cmp-container--article-page-content"
+_NEWSROOM_STRAINER = SoupStrainer(['h1', 'span', 'div'], class_=_class_token_re(
+    _NEWSROOM_TITLE_CLASS, _NEWSROOM_DATE_CLASS, "cmp-container--article-page-content"))
+_BLOG_TITLE_CLASS = "BlogFull__title"
+_BLOG_DATE_CLASS = "Author__byline-right"
+_BLOG_CONTENT_CLASS = "BlogFull__content"
+_BLOG_STRAINER = SoupStrainer(['h1', 'div'], class_=_class_token_re(
+    _BLOG_TITLE_CLASS, _BLOG_DATE_CLASS, _BLOG_CONTENT_CLASS))
+
+# Small newsroom fragments made only of paragraphs with simple inline markup
+# (no headings, lists, links or images) are rendered without building a tree
+_SIMPLE_FRAGMENT_MAX_CHARS = 4096
+_SIMPLE_FRAGMENT_RE = re.compile(
+    r'(?:\s*<p(?:\s[^<>]*)?>(?:[^<]|</?(?:b|strong|i|em|u|span|sup|sub|br)(?:\s[^<>]*)?/?>)*</p>)*\s*',
+    re.IGNORECASE
+)
+_PARAGRAPH_BODY_RE = re.compile(r'<p(?:\s[^<>]*)?>(.*?)</p>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]*>')
+_TAG_NAME_RE = re.compile(r'<(/?)([a-zA-Z]+)')
+
+def _balanced_inline_tags(body):
+    """True if a paragraph's inline tags nest properly, so lxml keeps every text node separate"""
+    open_tags = []
+    for closing, name in _TAG_NAME_RE.findall(body):
+        name = name.lower()
+        if name == 'br':
+            if closing:
+                return False
+        elif not closing:
+            open_tags.append(name)
+        elif not open_tags or open_tags.pop() != name:
+            return False
+    return not open_tags
+
+def _simple_paragraphs(html_text):
+    """
+    Paragraph texts of a small fragment with only simple inline markup, as
+    get_text(strip=True, separator=' ') would give them; None if the fragment
+    needs a real parse.
+    """
+    # lxml normalizes carriage returns, so leave those fragments to it too
+    if len(html_text) > _SIMPLE_FRAGMENT_MAX_CHARS or '\r' in html_text or not _SIMPLE_FRAGMENT_RE.fullmatch(html_text):
+        return None
+    paragraphs = []
+    for body in _PARAGRAPH_BODY_RE.findall(html_text):
+        if not _balanced_inline_tags(body):
+            return None
+        parts = (unescape(part).strip() for part in _TAG_RE.split(body))
+        paragraphs.append(' '.join(part for part in parts if part))
+    return paragraphs
+
+# Block elements rendered from a blog post's content, in document order
+_BLOG_BLOCK_TAGS = frozenset(['h2', 'p', 'ul', 'ol', 'article'])
+
+# Links and images that sit inside the text blocks the parsers render
+_BLOCK_LINKS = "p a[href], ul a[href], ol a[href]"
+_BLOCK_IMAGES = "p img, ul img, ol img"
+
 class OktaScraper:
     BASE_URL = "https://www.okta.com/blog/"
     DOMAIN = "Okta"
     NEWSROOM_URL_BASE = "https://www.okta.com/newsroom/articles/"
+    # Bodies are read in chunks and cut off here to guard against runaway responses
+    MAX_PAGE_BYTES = 5 * 1024 * 1024
+    # Bump whenever parsing output changes so cached posts are re-parsed
+    PARSER_VERSION = 1
 
     def __init__(self, config=None):
         self.session = requests.Session()
@@ -22,71 +128,113 @@ class OktaScraper:
             self.MAX_POSTS = config.get('max_posts', 5)
             self.REQUEST_TIMEOUT = config.get('request_timeout', 10)
             self.DELAY_BETWEEN_REQUESTS = config.get('delay_between_requests', 1)
+            self.MAX_CONCURRENT_REQUESTS = config.get('max_concurrent_requests', 4)
+            post_cache_path = config.get('post_cache_path')
         else:
             self.MAX_POSTS = 5
             self.REQUEST_TIMEOUT = 10
             self.DELAY_BETWEEN_REQUESTS = 1
+            self.MAX_CONCURRENT_REQUESTS = 4
+            post_cache_path = None
+
+        # Concurrent fetches share a bounded, politely spaced set of request slots
+        self.throttle = RequestThrottle(self.MAX_CONCURRENT_REQUESTS, self.DELAY_BETWEEN_REQUESTS)
+
+        # Parsed posts kept between runs so unchanged posts are revalidated, not re-scraped
+        self.post_cache = PostCache(post_cache_path, self.PARSER_VERSION) if post_cache_path else None
+
+        # Keep-alive pool sized for the concurrent post fetches
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _read_body(self, resp):
+        """Reads a streamed response as raw bytes (lxml decodes them), up to MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        for chunk in resp.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.MAX_PAGE_BYTES:
+                logger.warning(f"Truncating {resp.url} at {self.MAX_PAGE_BYTES} bytes")
+                break
+        return b"".join(chunks)[:self.MAX_PAGE_BYTES]
 
     def fetch_page(self, url):
         """Fetches page content and returns the final URL after redirects."""
         try:
-            resp = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            return resp.text, resp.url
+            with self.throttle, self.session.get(url, timeout=self.REQUEST_TIMEOUT, stream=True) as resp:
+                resp.raise_for_status()
+                return self._read_body(resp), resp.url
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None, url
 
+    def fetch_post(self, url, conditional=True):
+        """
+        Fetches a post, sending cached validators so an unchanged post comes back as 304.
+        With conditional=False the full post is requested, bypassing intermediate caches.
+        Returns (response, body), or (None, None) if the request failed.
+        """
+        if not conditional:
+            headers = {'Cache-Control': 'no-cache'}
+        else:
+            headers = self.post_cache.validators(url) if self.post_cache else None
+        try:
+            with self.throttle, self.session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT, stream=True) as resp:
+                resp.raise_for_status()
+                return resp, self._read_body(resp)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None, None
+
     def get_latest_post_links(self):
         """Scrape homepage for latest post URLs"""
         html, _ = self.fetch_page(self.BASE_URL)
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
-        links = []
-
-        # Target blog and newsroom links
-        selectors = [
-            "h2.BlogTeaser__title a[href]",
-            "a[href*='/blog/']",
-            "a[href*='/newsroom/articles/']"
-        ]
-
-        for selector in selectors:
-            for a_tag in soup.select(selector):
-                href = a_tag.get("href")
-                if href:
-                    full_url = urljoin(self.BASE_URL, href)
-                    if full_url not in links:
-                        links.append(full_url)
-                        if len(links) >= self.MAX_POSTS:
-                            break
-            if len(links) >= self.MAX_POSTS:
-                break
+        soup = BeautifulSoup(html, "lxml")
+
+        # Select all candidate links in one pass, then order them by the first
+        # pattern each one matches so teaser links still take priority
+        by_priority = [[] for _ in _POST_LINK_PATTERNS]
+        for a_tag in _POST_LINKS.select(soup):
+            for bucket, pattern in zip(by_priority, _POST_LINK_PATTERNS):
+                if pattern.match(a_tag):
+                    bucket.append(a_tag)
+                    break
+
+        links = {}  # insertion-ordered set
+        for a_tag in chain.from_iterable(by_priority):
+            href = a_tag.get("href")
+            if href:
+                links[urljoin(self.BASE_URL, href)] = None
+                if len(links) >= self.MAX_POSTS:
+                    break
 
         logger.info(f"Found {len(links)} latest posts")
-        return links
+        return list(links)
 
     def _parse_newsroom_content(self, soup, webpage_url):
         """Helper to parse a newsroom article's content from a JSON-like data attribute."""
         text_content = []
         img_urls = []
-        outbound_links = []
+        outbound_links = {}  # insertion-ordered set
 
         content_div = soup.find("div", attrs={"data-cmp-data-layer": True, "class": "cmp-text"})
         if not content_div:
-            return text_content, img_urls, outbound_links
+            return text_content, img_urls, list(outbound_links)
 
         data_layer = content_div.get("data-cmp-data-layer")
         try:
             data = json.loads(data_layer)
             text_key = next((k for k in data.keys() if k.startswith("text-")), None)
             if not text_key:
-                return text_content, img_urls, outbound_links
+                return text_content, img_urls, list(outbound_links)
             
             html_text = data[text_key].get("xdm:text", "")
-            content_soup = BeautifulSoup(html_text, "html.parser")
+            content_soup = BeautifulSoup(html_text, "lxml")
 
             all_elements = content_soup.find_all(['h3', 'p', 'ul', 'li', 'a', 'img', 'br'])
             current_section = ""
@@ -99,8 +247,7 @@ class OktaScraper:
                     for a_tag in element.find_all('a', href=True):
                         href = a_tag.get('href')
                         if href and href.startswith('http') and 'okta.com' not in href:
-                            if href not in outbound_links:
-                                outbound_links.append(href)
+                            outbound_links[href] = None
                     current_section += element.get_text(strip=True, separator=' ') + " \n "
                 elif element.name == 'ul':
                     list_items = []
@@ -121,27 +268,83 @@ class OktaScraper:
                 text_content.append(current_section.strip())
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON content for newsroom article {webpage_url}: {e}")
-        return text_content, img_urls, outbound_links
+        return text_content, img_urls, list(outbound_links)
+
+    def _parse_newsroom_fragment(self, html_text, webpage_url, text_content, img_urls, outbound_links):
+        """Renders a newsroom article's xdm:text HTML into the given result lists."""
+        paragraphs = _simple_paragraphs(html_text)
+        if paragraphs is not None:
+            section = "\n\n".join(text for text in paragraphs if text)
+            if section:
+                text_content.append(section)
+            return
 
-    def parse_newsroom_post(self, html, webpage_url):
+        content_soup = BeautifulSoup(html_text, "lxml")
+        
+        # Rewrite every block-level link and image as Markdown in one pass
+        # over the fragment, rather than re-searching each block
+        for a_tag in content_soup.select(_BLOCK_LINKS):
+            href = a_tag.get('href')
+            link_text = a_tag.get_text(strip=True)
+            if href:
+                full_href = urljoin(webpage_url, href)
+                a_tag.replace_with(f"[{link_text}]({full_href})")
+                if 'okta.com' not in full_href and full_href.startswith('http'):
+                    outbound_links[full_href] = None
+
+        for img_tag in content_soup.select(_BLOCK_IMAGES):
+            src = img_tag.get('src') or img_tag.get('data-src')
+            alt = img_tag.get('alt', '')
+            if src:
+                full_url = urljoin(webpage_url, src)
+                img_urls.append({"img_url": full_url, "alt_text": alt})
+                img_tag.replace_with(f"![{alt}]({full_url})")
+
+        current_section = ""
+        elements = content_soup.find_all(['p', 'h3', 'ul', 'ol'])
+        
+        for element in elements:
+            processed_text = ""
+            # Check for a new section starting with h3
+            if element.name == 'h3':
+                if current_section.strip():
+                    text_content.append(current_section.strip())
+                current_section = f"### {element.get_text(strip=True)}\n\n"
+                continue  # Continue to the next element
+
+            # Get the formatted text and append to current section
+            if element.name in ['ul', 'ol']:
+                list_items = [f"• {li.get_text(strip=True)}" for li in element.find_all('li')]
+                processed_text = "\n".join(list_items)
+            else: # p
+                processed_text = element.get_text(strip=True, separator=' ')
+
+            if processed_text:
+                current_section += processed_text.strip() + "\n\n"
+        
+        # Append the last section
+        if current_section.strip():
+            text_content.append(current_section.strip())
+
+    def parse_newsroom_post(self, html, webpage_url, date_pulled=None):
         """Extracts data from a newsroom article's HTML."""
-        soup = BeautifulSoup(html, "html.parser")
-        title_tag = soup.find("h1", class_="cmp-hero__title")
+        soup = BeautifulSoup(html, "lxml", parse_only=_NEWSROOM_STRAINER)
+        title_tag = soup.find("h1", class_=_NEWSROOM_TITLE_CLASS)
         title = title_tag.get_text(strip=True) if title_tag else "No Title"
         date_published = None
-        date_tag = soup.find("span", class_="cmp-hero__release-date__content")
+        date_tag = soup.find("span", class_=_NEWSROOM_DATE_CLASS)
         if date_tag:
             date_text = date_tag.get_text(strip=True)
             try:
-                date_object = datetime.strptime(date_text, "%d %B %Y")
-                date_published = date_object.date().isoformat()
+                date_published = _iso_date(_NEWSROOM_DATE_RE, date_text)
             except Exception as e:
                 logger.error(f"Could not parse newsroom date: {date_text}. Error: {e}")
                 date_published = None
         
-        text_content, img_urls, outbound_links = [], [], []
+        text_content, img_urls = [], []
+        outbound_links = {}  # insertion-ordered set
 
-        article_content_div = soup.find("div", class_="container responsivegrid cmp-container--article-page-content")
+        article_content_div = soup.find("div", class_=_NEWSROOM_CONTENT_CLASS)
         
         if article_content_div:
             content_div = article_content_div.find("div", attrs={"data-cmp-data-layer": True})
@@ -153,112 +356,59 @@ class OktaScraper:
                     text_key = next((k for k in data.keys() if k.startswith("text-")), None)
                     if text_key:
                         html_text = data[text_key].get("xdm:text", "")
-                        content_soup = BeautifulSoup(html_text, "html.parser")
-                        
-                        current_section = ""
-                        elements = content_soup.find_all(['p', 'h3', 'ul', 'ol'])
-                        
-                        for element in elements:
-                            processed_text = ""
-                            # Check for a new section starting with h3
-                            if element.name == 'h3':
-                                if current_section.strip():
-                                    text_content.append(current_section.strip())
-                                current_section = f"### {element.get_text(strip=True)}\n\n"
-                                continue  # Continue to the next element
-                            
-                            # Process links and images within the current element
-                            for a_tag in element.find_all('a', href=True):
-                                href = a_tag.get('href')
-                                link_text = a_tag.get_text(strip=True)
-                                if href:
-                                    full_href = urljoin(webpage_url, href)
-                                    a_tag.replace_with(f"[{link_text}]({full_href})")
-                                    if 'okta.com' not in full_href and full_href.startswith('http'):
-                                        if full_href not in outbound_links:
-                                            outbound_links.append(full_href)
-
-                            for img_tag in element.find_all('img'):
-                                src = img_tag.get('src') or img_tag.get('data-src')
-                                alt = img_tag.get('alt', '')
-                                if src:
-                                    full_url = urljoin(webpage_url, src)
-                                    img_urls.append({"img_url": full_url, "alt_text": alt})
-                                    img_tag.replace_with(f"![{alt}]({full_url})")
-
-                            # Get the formatted text and append to current section
-                            if element.name in ['ul', 'ol']:
-                                list_items = [f"• {li.get_text(strip=True)}" for li in element.find_all('li')]
-                                processed_text = "\n".join(list_items)
-                            else: # p
-                                processed_text = element.get_text(strip=True, separator=' ')
-
-                            if processed_text:
-                                current_section += processed_text.strip() + "\n\n"
-                        
-                        # Append the last section
-                        if current_section.strip():
-                            text_content.append(current_section.strip())
-                            
+                        self._parse_newsroom_fragment(html_text, webpage_url, text_content, img_urls, outbound_links)
+
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse JSON content for newsroom article {webpage_url}: {e}")
 
-        return self._create_post_data(title, date_published, webpage_url, text_content, img_urls, outbound_links)
+        return self._create_post_data(title, date_published, webpage_url, text_content, img_urls, list(outbound_links), date_pulled)
 
-    def parse_blog_post(self, html, webpage_url):
+    def parse_blog_post(self, html, webpage_url, date_pulled=None):
         """Extracts data from a blog post's HTML."""
-        soup = BeautifulSoup(html, "html.parser")
-        title_tag = soup.find("h1", class_="BlogFull__title")
+        soup = BeautifulSoup(html, "lxml", parse_only=_BLOG_STRAINER)
+        title_tag = soup.find("h1", class_=_BLOG_TITLE_CLASS)
         title = title_tag.get_text(strip=True) if title_tag else "No Title"
         date_published = None
-        date_tag = soup.find("div", class_="Author__byline-right")
+        date_tag = soup.find("div", class_=_BLOG_DATE_CLASS)
         if date_tag:
             date_text = date_tag.get_text(strip=True)
             try:
-                date_object = datetime.strptime(date_text, "%B %d, %Y")
-                date_published = date_object.date().isoformat()
+                date_published = _iso_date(_BLOG_DATE_RE, date_text)
             except Exception:
                 date_published = None
-        content_section = soup.find("div", class_="BlogFull__content")
-        text_content, img_urls, outbound_links = [], [], []
+        content_section = soup.find("div", class_=_BLOG_CONTENT_CLASS)
+        text_content, img_urls = [], []
+        outbound_links = {}  # insertion-ordered set
         if content_section:
+            # Collect outbound links from all text blocks in a single document-order pass
+            for a_tag in content_section.select(_BLOCK_LINKS):
+                href = a_tag.get('href')
+                if href.startswith('http') and 'okta.com' not in href:
+                    outbound_links[href] = None
+
             current_section = ""
-            elements = content_section.find_all(['h2', 'p', 'ul', 'ol', 'article'], recursive=True)
+            # Stream block elements in document order (text nodes have no name)
+            elements = (node for node in content_section.descendants if node.name in _BLOG_BLOCK_TAGS)
             for element in elements:
                 if element.name == 'h2':
                     if current_section.strip():
                         text_content.append(current_section.strip())
                     heading_text = element.get_text(strip=True)
                     current_section = f"## {heading_text}\n"
-                elif element.name in ['p', 'ul', 'ol']:
-                    for a_tag in element.find_all('a', href=True):
-                        href = a_tag.get('href')
-                        if href.startswith('http') and 'okta.com' not in href:
-                            if href not in outbound_links:
-                                outbound_links.append(href)
-                    element_copy = element.__copy__()
-                    for img in element_copy.find_all('img'):
-                        parent_article = img.find_parent('article')
-                        if parent_article and 'media--type-image' in ' '.join(parent_article.get('class', [])):
+                elif element.name == 'p':
+                    section_text = ' '.join(self._blog_text_parts(element, webpage_url, img_urls, element.interesting_string_types))
+                    if section_text:
+                        current_section += section_text + " \n "
+                elif element.name in ['ul', 'ol']:
+                    # A list's text comes from its items, so nothing is rewritten; only
+                    # images inside nested image articles are recorded
+                    for img in element.select(':scope article img'):
+                        if 'media--type-image' in ' '.join(img.find_parent('article').get('class', [])):
                             src = img.get('src') or img.get('data-src')
-                            alt = img.get('alt', '')
                             if src:
-                                full_url = urljoin(webpage_url, src)
-                                img_urls.append({"img_url": full_url, "alt_text": alt})
-                                img.replace_with(f"![{alt} (image)]({full_url})")
-                    for a_tag in element_copy.find_all('a', href=True):
-                        href = a_tag.get('href')
-                        link_text = a_tag.get_text(strip=True)
-                        if href:
-                            full_href = urljoin(webpage_url, href) if not href.startswith('http') else href
-                            a_tag.replace_with(f"[{link_text}]({full_href})")
-                    section_text = element_copy.get_text(separator=' ', strip=True)
-                    if element.name in ['ul', 'ol']:
-                        formatted_text = ""
-                        for li in element.find_all('li'):
-                            if li.get_text(strip=True):
-                                formatted_text += f"• {li.get_text(strip=True)}\n"
-                        section_text = formatted_text.strip()
+                                img_urls.append({"img_url": urljoin(webpage_url, src), "alt_text": img.get('alt', '')})
+                    li_texts = [li.get_text(strip=True) for li in element.find_all('li')]
+                    section_text = "\n".join(f"• {li_text}" for li_text in li_texts if li_text)
                     if section_text:
                         current_section += section_text + " \n "
                 elif element.name == 'article':
@@ -275,12 +425,45 @@ class OktaScraper:
                 text_content.append(current_section.strip())
             if not text_content and content_section.get_text(strip=True):
                 text_content.append(content_section.get_text(strip=True, separator='\n'))
-        return self._create_post_data(title, date_published, webpage_url, text_content, img_urls, outbound_links)
+        return self._create_post_data(title, date_published, webpage_url, text_content, img_urls, list(outbound_links), date_pulled)
+
+    def _blog_text_parts(self, parent, webpage_url, img_urls, string_types, in_image_article=False, in_link=False):
+        """
+        Yields the stripped text pieces under parent, as get_text(strip=True) would,
+        with links and images inside image articles rendered as Markdown. Walks the
+        tree once and leaves it untouched.
+        """
+        for node in parent.children:
+            name = node.name  # None for text nodes
+            if name is None:
+                if type(node) in string_types:
+                    text = node.strip()
+                    if text:
+                        yield text
+            elif name == 'img':
+                src = node.get('src') or node.get('data-src')
+                if in_image_article and src:
+                    alt = node.get('alt', '')
+                    full_url = urljoin(webpage_url, src)
+                    img_urls.append({"img_url": full_url, "alt_text": alt})
+                    yield f"![{alt} (image)]({full_url})"
+            elif name == 'a' and node.get('href') and not in_link:
+                # Link text includes any rendered images; nested links stay plain text
+                href = node['href']
+                full_href = urljoin(webpage_url, href) if not href.startswith('http') else href
+                link_text = ''.join(self._blog_text_parts(node, webpage_url, img_urls, node.interesting_string_types, in_image_article, True))
+                yield f"[{link_text}]({full_href})"
+            else:
+                # Only the nearest enclosing article decides whether images are rendered
+                child_in_image_article = in_image_article
+                if name == 'article':
+                    child_in_image_article = 'media--type-image' in ' '.join(node.get('class', []))
+                yield from self._blog_text_parts(node, webpage_url, img_urls, string_types, child_in_image_article, in_link)
 
-    def _create_post_data(self, title, date_published, webpage_url, text_content, img_urls, outbound_links):
+    def _create_post_data(self, title, date_published, webpage_url, text_content, img_urls, outbound_links, date_pulled=None):
         """Helper to create the final data dictionary."""
-        eastern = pytz.timezone('US/Eastern')
-        date_pulled = datetime.now(eastern).date().isoformat()
+        if date_pulled is None:
+            date_pulled = datetime.now(_EASTERN).date().isoformat()
         return {
             "company": self.DOMAIN,
             "title": title,
@@ -295,15 +478,41 @@ class OktaScraper:
     def scrape_all_posts(self):
         """Convenience method to get links and parse all posts, handling redirects."""
         post_urls = self.get_latest_post_links()
+        if not post_urls:
+            return []
+
+        # Every post in a batch shares the same pull date
+        date_pulled = datetime.now(_EASTERN).date().isoformat()
+
+        # Fetches overlap on the shared session, paced by the throttle; parsing stays serial in link order
+        with ThreadPoolExecutor(max_workers=min(len(post_urls), 8)) as executor:
+            responses = list(executor.map(self.fetch_post, post_urls))
+
         posts_data = []
-        for url in post_urls:
+        for url, (resp, html) in zip(post_urls, responses):
+            if resp is None:
+                continue
+            if resp.status_code == 304:
+                post_data = self.post_cache.get(url) if self.post_cache else None
+                if post_data:
+                    logger.info(f"Post unchanged, reusing cached copy: {url}")
+                    post_data["date_pulled"] = date_pulled
+                    posts_data.append(post_data)
+                    continue
+                # A proxy or server answered 304 with nothing cached to serve it from
+                resp, html = self.fetch_post(url, conditional=False)
+                if resp is None or resp.status_code == 304:
+                    continue
+
             logger.info(f"Parsing post: {url}")
-            html, final_url = self.fetch_page(url)
+            final_url = resp.url
             if html:
                 if self.NEWSROOM_URL_BASE in final_url:
-                    post_data = self.parse_newsroom_post(html, final_url)
+                    post_data = self.parse_newsroom_post(html, final_url, date_pulled)
                 else:
-                    post_data = self.parse_blog_post(html, final_url)
+                    post_data = self.parse_blog_post(html, final_url, date_pulled)
                 if post_data:
+                    if self.post_cache:
+                        self.post_cache.put(url, resp.headers.get('ETag'), resp.headers.get('Last-Modified'), post_data)
                     posts_data.append(post_data)
         return posts_data
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""On-disk cache of parsed posts, revalidated with conditional GETs"""
+import json
+import sqlite3
+import threading
+
+class PostCache:
+    """
+    Stores each post's parsed data with the ETag/Last-Modified validators it
+    was served with, keyed by the URL it was requested from.
+
+    Scrapers send the validators back as If-None-Match/If-Modified-Since and,
+    on a 304, reuse the stored post instead of downloading and parsing it
+    again. A digest of the page body can be stored too, so a full 200
+    response whose body hasn't changed is also answered from the cache.
+    Safe to share across the fetch worker threads.
+
+    Rows record the `parser_version` of the scraper that wrote them. Rows
+    from any other version are treated as misses, with no validators sent,
+    so bumping a scraper's parser version re-parses every cached post.
+    """
+
+    def __init__(self, path, parser_version=1):
+        self.parser_version = parser_version
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS posts ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, data_json TEXT NOT NULL, body_hash TEXT, "
+                "parser_version INTEGER)"
+            )
+            # Caches created before body digests or parser versions were stored lack those columns;
+            # their rows have no parser version and so are never served
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(posts)")}
+            if 'body_hash' not in columns:
+                self._conn.execute("ALTER TABLE posts ADD COLUMN body_hash TEXT")
+            if 'parser_version' not in columns:
+                self._conn.execute("ALTER TABLE posts ADD COLUMN parser_version INTEGER")
+
+    def validators(self, url):
+        """Conditional request headers for a cached URL (empty if it isn't cached by this parser version)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM posts WHERE url = ? AND parser_version = ?",
+                (url, self.parser_version)
+            ).fetchone()
+        if not row:
+            return {}
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, url):
+        """Cached post data for a URL, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data_json FROM posts WHERE url = ? AND parser_version = ?",
+                (url, self.parser_version)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_unchanged(self, url, body_hash):
+        """Cached post data for a URL if it was parsed from a body with this digest, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data_json FROM posts WHERE url = ? AND body_hash = ? AND parser_version = ?",
+                (url, body_hash, self.parser_version)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, url, etag, last_modified, post_data, body_hash=None):
+        """Store a freshly parsed post; responses with no validators or body digest aren't worth keeping"""
+        if not etag and not last_modified and not body_hash:
+            return
+        data_json = json.dumps(post_data, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO posts (url, etag, last_modified, data_json, body_hash, parser_version) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, data_json, body_hash, self.parser_version)
+            )
@@ -0,0 +1,30 @@
+"""Request throttling shared by the scrapers' concurrent fetches"""
+import threading
+
+class RequestThrottle:
+    """
+    Bounds in-flight requests to one site and spaces them out politely.
+
+    Use as a context manager around each request. At most `max_concurrent`
+    requests run at once, and a slot is only handed to the next request
+    `delay` seconds after the previous holder finished. The delay runs on a
+    timer, so the finishing thread moves straight on to parsing instead of
+    sleeping.
+    """
+
+    def __init__(self, max_concurrent, delay=0):
+        self.delay = delay
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+
+    def __enter__(self):
+        self._slots.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.delay > 0:
+            timer = threading.Timer(self.delay, self._slots.release)
+            timer.daemon = True
+            timer.start()
+        else:
+            self._slots.release()
+        return False
@@ -1,10 +1,23 @@
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
 
 BACKEND_URL = os.getenv("BACKEND_URL", "https://sacr-backend.onrender.com") + "/ask"
 
+# Any image URL (common image extensions) in an answer is rendered inline
+IMAGE_URL_RE = re.compile(r"(https?://\S+\.(?:png|jpg|jpeg|gif|webp|svg))", re.IGNORECASE)
+
+@st.cache_resource
+def get_session():
+    """Session shared across reruns so backend calls reuse keep-alive connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 # Initialize session state
 if "is_busy" not in st.session_state:
     st.session_state.is_busy = False
@@ -24,7 +37,7 @@ if submit_button:
 if st.session_state.is_busy:
     try:
         with st.spinner("Processing your request..."):
-            response = requests.post(BACKEND_URL, json={"query": query})
+            response = get_session().post(BACKEND_URL, json={"query": query})
 
         if response.status_code == 200:
             st.session_state.result_data = response.json()
@@ -52,17 +65,14 @@ if st.session_state.result_data:
     elif "answer" in data and "answer" in data["answer"]:
         main_answer = data["answer"]["answer"]
 
-        # Split answer into text segments and images inline
-        # Regex to find any image URL (common image extensions)
-        image_pattern = r"(https?://\S+\.(?:png|jpg|jpeg|gif|webp|svg))"
-        parts = re.split(image_pattern, main_answer)
+        # Split answer into text segments and images inline; with the capturing
+        # group, every odd-indexed part is an image URL
+        parts = IMAGE_URL_RE.split(main_answer)
 
-        for part in parts:
-            if re.match(image_pattern, part):
-                st.write(part)
+        for i, part in enumerate(parts):
+            st.write(part)
+            if i % 2:
                 st.image(part, caption="Relevant chart/figure")
-            else:
-                st.write(part)
 
         # Show sources
         if "sources" in data["answer"]:
@@ -7,6 +7,7 @@ import json
 from typing import List, Dict, Any
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from azure.search.documents import SearchClient
 from azure.search.documents.indexes import SearchIndexClient
@@ -36,6 +37,9 @@ from config import *
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chunks embedded per request; Azure OpenAI accepts up to 16 inputs on every embedding deployment
+EMBEDDING_BATCH_SIZE = 16
+
 class AISearchSetup:
     def __init__(self):
         """Initialize AI Search setup with configuration"""
@@ -61,6 +65,21 @@ class AISearchSetup:
         self.index_name = INDEX_NAME
         self.output_dir = OUTPUT_DIR
 
+        # One SearchClient per index, reused across uploads, tests and stats
+        self._search_clients = {}
+
+    def _get_search_client(self, index_name: str) -> SearchClient:
+        """Return the cached SearchClient for an index, creating it on first use"""
+        client = self._search_clients.get(index_name)
+        if client is None:
+            client = SearchClient(
+                endpoint=self.search_endpoint,
+                index_name=index_name,
+                credential=self.search_credential
+            )
+            self._search_clients[index_name] = client
+        return client
+
     def create_hybrid_search_index(self, index_name: str = None) -> bool:
         """Create a hybrid search index optimized for RAG with semantic search"""
         index_name = index_name or self.index_name
@@ -216,6 +235,16 @@ class AISearchSetup:
             timeout=120  # Set a timeout in seconds
         )
         return response.data[0].embedding
+
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
+    def _create_embeddings(self, contents: List[str]) -> List[List[float]]:
+        """Helper to embed several texts in one request, with retry logic."""
+        response = self.azure_client.embeddings.create(
+            input=contents,
+            model=self.embedding_deployment,
+            timeout=120
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
     
     def generate_embeddings_for_documents(self, documents: List[Dict]) -> List[Dict]:
             """Generate embeddings for documents that don't have them"""
@@ -223,17 +252,29 @@ class AISearchSetup:
 
             enhanced_docs = []
 
-            for i, doc in enumerate(documents):
-                logger.info(f"Processing document {i+1}/{len(documents)}: {doc['chunk_id']}")
+            for start in range(0, len(documents), EMBEDDING_BATCH_SIZE):
+                batch = documents[start:start + EMBEDDING_BATCH_SIZE]
+                logger.info(f"Processing documents {start+1}-{start+len(batch)}/{len(documents)}")
 
                 try:
-                    # Use the new helper function with retry logic
-                    doc['content_vector'] = self._create_embedding(doc['content'])
-                    enhanced_docs.append(doc)
-
-                except Exception as e:
-                    logger.error(f"Error generating embedding for {doc['chunk_id']}: {e}")
+                    # One round-trip for the whole batch
+                    vectors = self._create_embeddings([doc['content'] for doc in batch])
+                    for doc, vector in zip(batch, vectors):
+                        doc['content_vector'] = vector
+                    enhanced_docs.extend(batch)
                     continue
+                except Exception as e:
+                    logger.error(f"Batch embedding failed, retrying documents one by one: {e}")
+
+                # Embed individually so one bad document doesn't drop the rest of its batch
+                for doc in batch:
+                    try:
+                        doc['content_vector'] = self._create_embedding(doc['content'])
+                        enhanced_docs.append(doc)
+
+                    except Exception as e:
+                        logger.error(f"Error generating embedding for {doc['chunk_id']}: {e}")
+                        continue
 
             logger.info(f"Generated embeddings for {len(enhanced_docs)} documents")
             return enhanced_docs
@@ -277,11 +318,7 @@ class AISearchSetup:
         logger.info(f"Uploading {len(documents)} documents to index: {index_name}")
 
         try:
-            search_client = SearchClient(
-                endpoint=self.search_endpoint,
-                index_name=index_name,
-                credential=self.search_credential
-            )
+            search_client = self._get_search_client(index_name)
 
             # Upload in batches to avoid timeouts
             batch_size = 100
@@ -317,11 +354,7 @@ class AISearchSetup:
         logger.info(f"Testing search functionality on index: {index_name}")
 
         try:
-            search_client = SearchClient(
-                endpoint=self.search_endpoint,
-                index_name=index_name,
-                credential=self.search_credential
-            )
+            search_client = self._get_search_client(index_name)
 
             # Test 1: Simple text search
             logger.info("\nTest 1: Simple text search for 'security'")
@@ -387,33 +420,25 @@ class AISearchSetup:
         index_name = index_name or self.index_name
         
         try:
-            search_client = SearchClient(
-                endpoint=self.search_endpoint,
-                index_name=index_name,
-                credential=self.search_credential
-            )
+            search_client = self._get_search_client(index_name)
 
-            # Get total document count
-            results = search_client.search(search_text="*", include_total_count=True, top=0)
-            total_docs = results.get_count()
+            # Results are paged lazily: each query is only sent when its count or facets are read
+            def get_count(**filters):
+                return search_client.search(search_text="*", include_total_count=True, top=0, **filters).get_count()
 
-            # Get documents with images count
-            results = search_client.search(
-                search_text="*",
-                filter="has_images eq true",
-                include_total_count=True,
-                top=0
-            )
-            docs_with_images = results.get_count()
+            def get_company_facets():
+                results = search_client.search(search_text="*", facets=["company"], top=0)
+                return results.get_facets().get("company", [])
 
-            # Get company distribution
-            results = search_client.search(
-                search_text="*",
-                facets=["company"],
-                top=0
-            )
+            # The three queries are independent, so they run concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                total_future = executor.submit(get_count)
+                images_future = executor.submit(get_count, filter="has_images eq true")
+                facets_future = executor.submit(get_company_facets)
 
-            company_facets = results.get_facets().get("company", [])
+            total_docs = total_future.result()
+            docs_with_images = images_future.result()
+            company_facets = facets_future.result()
 
             stats = {
                 "total_documents": total_docs,
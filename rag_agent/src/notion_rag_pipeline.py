@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import List, Dict, Any
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import notion_client
 from openai import AzureOpenAI
@@ -19,6 +21,20 @@ from config import *
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static OCR instructions, sent alongside each image
+OCR_PROMPT = """Extract all text from this image. If it contains diagrams, charts, or technical content, also describe the key information shown.
+
+Format your response as:
+TEXT: [extracted text here]
+DESCRIPTION: [brief description of visual content if relevant]
+
+If no text is found, just provide the description."""
+
+# Notion allows ~3 requests/s per integration: fetch at most this many pages'
+# blocks at once, and start requests no faster than that rate
+NOTION_MAX_CONCURRENCY = 3
+NOTION_REQUESTS_PER_SECOND = 3
+
 class NotionRAGPipeline:
     def __init__(self):
         """Initialize the pipeline with configuration from environment variables"""
@@ -37,6 +53,9 @@ class NotionRAGPipeline:
         self.max_tokens = MAX_TOKENS_PER_CHUNK
         self.overlap_tokens = OVERLAP_TOKENS
         self.output_dir = OUTPUT_DIR
+        # Shared by the block-fetch workers to pace their Notion requests
+        self._notion_pacing_lock = threading.Lock()
+        self._next_notion_request = 0.0
 
     def get_notion_pages(self, limit: int = None) -> List[Dict]:
         """Fetch pages from Notion database with all properties and blocks"""
@@ -49,19 +68,20 @@ class NotionRAGPipeline:
                 page_size=min(limit, 100)  # Notion API limit
             )
 
-            pages_data = []
-            for page in response['results']:
-                page_title = self._safe_get_title(page)
-                logger.info(f"Processing page: {page_title}")
+            pages = response['results'][:limit]
+            for page in pages:
+                logger.info(f"Processing page: {self._safe_get_title(page)}")
 
+            # Each page's blocks are listed independently, so the listings overlap
+            with ThreadPoolExecutor(max_workers=NOTION_MAX_CONCURRENCY) as executor:
+                page_blocks = list(executor.map(self._get_page_blocks, [page['id'] for page in pages]))
+
+            pages_data = []
+            for page, blocks in zip(pages, page_blocks):
                 page_info = self._extract_page_properties(page)
-                blocks = self._get_page_blocks(page['id'])
                 page_info['blocks'] = blocks
                 pages_data.append(page_info)
 
-                if len(pages_data) >= limit:
-                    break
-
             logger.info(f"Successfully fetched {len(pages_data)} pages")
             return pages_data
 
@@ -116,6 +136,7 @@ class NotionRAGPipeline:
 
         while True:
             try:
+                self._wait_for_notion_turn()
                 response = self.notion.blocks.children.list(
                     block_id=page_id,
                     start_cursor=start_cursor,
@@ -133,6 +154,15 @@ class NotionRAGPipeline:
 
         return blocks
 
+    def _wait_for_notion_turn(self):
+        """Blocks until this thread may send its next Notion request under the rate limit"""
+        with self._notion_pacing_lock:
+            now = time.monotonic()
+            start = max(now, self._next_notion_request)
+            self._next_notion_request = start + 1 / NOTION_REQUESTS_PER_SECOND
+        if start > now:
+            time.sleep(start - now)
+
     def load_processing_tracker(self, tracker_file: str = None) -> Dict:
         """Load the processing tracker"""
         tracker_file = tracker_file or os.path.join(self.output_dir, "processed_pages.json")
@@ -203,21 +233,13 @@ class NotionRAGPipeline:
         try:
             logger.info(f"Processing image with GPT-4o: {alt_text[:50]}...")
 
-            prompt = """Extract all text from this image. If it contains diagrams, charts, or technical content, also describe the key information shown.
-
-Format your response as:
-TEXT: [extracted text here]
-DESCRIPTION: [brief description of visual content if relevant]
-
-If no text is found, just provide the description."""
-
             response = self.azure_client.chat.completions.create(
                 model=self.gpt4o_deployment,
                 messages=[
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": prompt},
+                            {"type": "text", "text": OCR_PROMPT},
                             {"type": "image_url", "image_url": {"url": image_url}}
                         ]
                     }
@@ -361,6 +383,8 @@ If no text is found, just provide the description."""
                 else:
                     current_chunk['text'] = block['text']
                     current_chunk['enhanced_text'] = block['enhanced_text']
+                # enhanced_text is now potential_enhanced, whose tokens were just counted
+                current_chunk['token_count'] = token_count
 
                 current_chunk['blocks'].append(block)
                 if block.get('image_url'):
@@ -391,7 +415,7 @@ If no text is found, just provide the description."""
             'chunk_id': chunk_id,
             'text': chunk_data['text'],
             'enhanced_content': chunk_data['enhanced_text'],
-            'token_count': len(self.tokenizer.encode(chunk_data['enhanced_text'])),
+            'token_count': chunk_data.get('token_count') or len(self.tokenizer.encode(chunk_data['enhanced_text'])),
             'metadata': {
                 'page_level': {
                     'notion_page_id': page_metadata['notion_page_id'],